@@ -1,48 +1,23 @@
+import metrics
+metrics.begin()  # waktu import & tiap bagian halaman (lihat metrics.py)
+
 import streamlit as st
 import pandas as pd
-import numpy as np
 import time
 import re
-import io
-import zipfile
-from io import BytesIO
-
-def format_rupiah(x):
-    if pd.isna(x):
-        return ""
-    # pastikan bisa diubah ke float
-    try:
-        x = float(x)
-    except:
-        return x  # biarin apa adanya kalau bukan angka
-
-    # kalau tidak punya desimal (misal 7000.0), tampilkan tanpa ,00
-    if x.is_integer():
-        formatted = f"{int(x):,}".replace(",", ".")
-    else:
-        formatted = f"{x:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-        # hapus ,00 kalau desimalnya 0 semua (misal 7000,00 → 7000)
-        if formatted.endswith(",00"):
-            formatted = formatted[:-3]
-    return formatted
-
-def highlight_total(row):
-    if any(str(x).strip().upper() == "TOTAL" for x in row):
-        return ["font-weight: bold; background-color: #D9EAD3; color: #1A5E20;"] * len(row)
-    else:
-        return [""] * len(row)
-    
-def highlight_1st_2nd(row, columns):
-    styles = [""] * len(columns)
-    first_vendor = row.get("1st Vendor")
-    second_vendor = row.get("2nd Vendor")
-
-    for i, col in enumerate(columns):
-        if col == first_vendor:
-            styles[i] = "background-color: #C6EFCE; color: #006100;"
-        elif col == second_vendor:
-            styles[i] = "background-color: #FFEB9C; color: #9C6500;"
-    return styles
+from functools import partial
+
+from export import cached_multi_sheet_excel
+from formatting import rupiah_formatters
+import charts
+import coldstart
+import ingest
+import static_cache
+import styling
+import table_view
+import tco
+
+metrics.mark("imports")
 
 st.markdown(
     """
@@ -396,19 +371,13 @@ st.markdown(
 )
 
 st.divider()
+metrics.mark("user guide")
 
 st.markdown("#### What is Displayed?")
 
 # Path file Excel yang sudah ada
 file_paths = ["Round 1.xlsx", "Round 2.xlsx", "Round 3.xlsx", "Round 4.xlsx"]
 
-# Buat ZIP di memory
-zip_buffer = io.BytesIO()
-with zipfile.ZipFile(zip_buffer, "w") as zf:
-    for file_path in file_paths:
-        zf.write(file_path, arcname=file_path.split("/")[-1])  # arcname = nama file di ZIP
-zip_buffer.seek(0)
-
 # Markdown teks
 st.markdown(
     """
@@ -423,10 +392,11 @@ st.markdown(
 def release_the_balloons():
     st.balloons()
 
-# Download button untuk file Excel
+# Download button untuk file Excel. ZIP baru dibuat saat tombol diklik
+# (sekali per proses, dibangun ulang kalau file round-nya berubah)
 st.download_button(
     label="Dummy Dataset",
-    data=zip_buffer,
+    data=partial(static_cache.zip_of, file_paths),
     file_name="Dummy Dataset - TCO Comparison Round by Round.zip",
     mime="application/zip",
     on_click=release_the_balloons,
@@ -455,35 +425,34 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-# DataFrame
-columns = ["ROUND", "TCO Component", "Vendor A", "Vendor B", "Vendor C"]
-data = [
-    ["Round 1", "Software", 12000, 13500, 11000],
-    ["Round 1", "Hardware", 25000, 24000, 23000],
-    ["Round 1", "TOTAL", 37000, 37500, 34000],
-
-    ["Round 2", "Software", 9850, 10230, 9570],
-    ["Round 2", "Hardware", 18020, 17590, 16980],
-    ["Round 2", "TOTAL", 27870, 27820, 26550],
-
-    ["Round 3", "Software", 14530, 15210, 13960],
-    ["Round 3", "Hardware", 31080, 29840, 28590],
-    ["Round 3", "TOTAL", 45610, 45050, 42550],
-
-    ["Round 4", "Software", 13420, 12090, 11560],
-    ["Round 4", "Hardware", 19570, 27840, 26510],
-    ["Round 4", "TOTAL", 32990, 39930, 38070],
-]
-df_merge = pd.DataFrame(data, columns=columns)
+# DataFrame (dihitung dari file round dummy, disimpan di table_store dan
+# dibaca lewat memory map, sekali per proses; TCO_SNAPSHOT=1 → dibaca dari
+# snapshot yang dibuat `python coldstart.py build`)
+def build_tables(paths):
+    with metrics.timed("build.ingest"):
+        rounds, timings = ingest.load_rounds(paths)
+    # waktu baca/parse (atau ambil dari cache) tiap file round
+    for name, seconds in timings.items():
+        metrics.stage(f"ingest.{name}", seconds)
+    return tco.build_tables(rounds)
 
-num_cols = ["Vendor A", "Vendor B", "Vendor C"]
-df_merge_styled = (
-    df_merge.style
-    .format({col: format_rupiah for col in num_cols})
-    .apply(highlight_total, axis=1)
+tables = static_cache.cached_build(
+    ("tables",) + tuple(file_paths), file_paths,
+    lambda paths: coldstart.cached_tables(paths, build_tables),
 )
+metrics.mark("tables")
+df_merge = tables["Merge Data"]
+vendor_cols = list(df_merge.select_dtypes("number").columns)
+
+def style_merge(window):
+    return (
+        window.style
+        .format(rupiah_formatters(window, vendor_cols))
+        .pipe(styling.highlight_total)
+    )
 
-st.dataframe(df_merge_styled, hide_index=True)
+table_view.windowed_dataframe(df_merge, style_merge, key="merge")
+metrics.mark("merge data")
 
 st.write("")
 st.markdown("**:orange-badge[2. COST SUMMARY]**")
@@ -499,66 +468,17 @@ st.markdown(
 )
 
 # DataFrame
-columns = ["ROUND", "VENDOR", "TCO Component", "PRICE"]
-data = [
-    ["Round 1", "Vendor A", "Hardware", 25000],
-    ["Round 1", "Vendor A", "Software", 12000],
-    ["Round 1", "Vendor A", "TOTAL", 37000],
-
-    ["Round 1", "Vendor B", "Hardware", 24000],
-    ["Round 1", "Vendor B", "Software", 13500],
-    ["Round 1", "Vendor B", "TOTAL", 37500],
-
-    ["Round 1", "Vendor C", "Hardware", 23000],
-    ["Round 1", "Vendor C", "Software", 11000],
-    ["Round 1", "Vendor C", "TOTAL", 34000],
-
-    ["Round 2", "Vendor A", "Hardware", 18020],
-    ["Round 2", "Vendor A", "Software", 9850],
-    ["Round 2", "Vendor A", "TOTAL", 27870],
-
-    ["Round 2", "Vendor B", "Hardware", 17590],
-    ["Round 2", "Vendor B", "Software", 10230],
-    ["Round 2", "Vendor B", "TOTAL", 27820],
-
-    ["Round 2", "Vendor C", "Hardware", 16980],
-    ["Round 2", "Vendor C", "Software", 9570],
-    ["Round 2", "Vendor C", "TOTAL", 26550],
+df_summary = tables["Cost Summary"]
 
-    ["Round 3", "Vendor A", "Hardware", 31080],
-    ["Round 3", "Vendor A", "Software", 14530],
-    ["Round 3", "Vendor A", "TOTAL", 45610],
-
-    ["Round 3", "Vendor B", "Hardware", 29840],
-    ["Round 3", "Vendor B", "Software", 15210],
-    ["Round 3", "Vendor B", "TOTAL", 45050],
-
-    ["Round 3", "Vendor C", "Hardware", 28590],
-    ["Round 3", "Vendor C", "Software", 13960],
-    ["Round 3", "Vendor C", "TOTAL", 42550],
-
-    ["Round 4", "Vendor A", "Hardware", 19570],
-    ["Round 4", "Vendor A", "Software", 13420],
-    ["Round 4", "Vendor A", "TOTAL", 32990],
-
-    ["Round 4", "Vendor B", "Hardware", 27840],
-    ["Round 4", "Vendor B", "Software", 12090],
-    ["Round 4", "Vendor B", "TOTAL", 39930],
-
-    ["Round 4", "Vendor C", "Hardware", 26510],
-    ["Round 4", "Vendor C", "Software", 11560],
-    ["Round 4", "Vendor C", "TOTAL", 38070],
-]
-df_summary = pd.DataFrame(data, columns=columns)
-
-num_cols = ["PRICE"]
-df_summary_styled = (
-    df_summary.style
-    .format({col: format_rupiah for col in num_cols})
-    .apply(highlight_total, axis=1)
-)
+def style_summary(window):
+    return (
+        window.style
+        .format(rupiah_formatters(window, ["PRICE"]))
+        .pipe(styling.highlight_total)
+    )
 
-st.dataframe(df_summary_styled, hide_index=True)
+table_view.windowed_dataframe(df_summary, style_summary, key="summary")
+metrics.mark("cost summary")
 
 st.write("")
 st.markdown("**:yellow-badge[3. PIVOT TABLE]**")
@@ -574,21 +494,16 @@ st.markdown(
 )
 
 # DataFrame
-columns = ["TCO Component", "Vendor A Round 1", "Vendor A Round 2", "Vendor A Round 3", "Vendor A Round 4", "Vendor B Round 1", "Vendor B Round 2", "Vendor B Round 3", "Vendor B Round 4", "Vendor C Round 1", "Vendor C Round 2", "Vendor C Round 3", "Vendor C Round 4"]
-data = [
-    ["Software", 25000,18020,31080,19570,24000,17590,29840,27840,23000,16980,28590,26510],
-    ["Hardware", 12000,9850,14530,13420,13500,10230,15210,12090,11000,9570,13960,11560],
-    ["TOTAL", 37000,27870,45610,32990,37500,27820,45050,39930,34000,26550,42550,38070]
-]
-df_pivot = pd.DataFrame(data, columns=columns)
+df_pivot = tables["Pivot Table"]
 
-num_cols = ["Vendor A Round 1", "Vendor A Round 2", "Vendor A Round 3", "Vendor A Round 4", "Vendor B Round 1", "Vendor B Round 2", "Vendor B Round 3", "Vendor B Round 4", "Vendor C Round 1", "Vendor C Round 2", "Vendor C Round 3", "Vendor C Round 4"]
+num_cols = list(df_pivot.select_dtypes("number").columns)
 df_pivot_styled = (
     df_pivot.style
-    .format({col: format_rupiah for col in num_cols})
-    .apply(highlight_total, axis=1)
+    .format(rupiah_formatters(df_pivot, num_cols))
+    .pipe(styling.highlight_total)
 )
 st.dataframe(df_pivot_styled, hide_index=True)
+metrics.mark("pivot table")
 
 st.write("")
 st.markdown("**:green-badge[4. BID & PRICE ANALYSIS]**")
@@ -614,37 +529,23 @@ st.markdown(
 )
 
 # DataFrame
-columns = ["ROUND", "TCO Component", "Vendor A", "Vendor B", "Vendor C", "1st Lowest", "1st Vendor", "2nd Lowest", "2nd Vendor", "Gap 1 to 2 (%)", "Median Price", "Vendor A to Median (%)", "Vendor B to Median (%)", "Vendor C to Median (%)"]
-data = [
-    ["Round 1", "Software", 12000,13500,11000,11000,"Vendor C",12000,"Vendor A", 9.1, 12000, 0, 12.5, -8.3],
-    ["Round 1", "Hardware", 25000,24000,23000,23000,"Vendor C",24000,"Vendor B", 4.3, 24000, 4.2, 0, -4.2],
+df_analysis = tables["Bid & Price Analysis"]
 
-    ["Round 2", "Software", 9850,10230,9570,9570,"Vendor C",9850,"Vendor A", 2.9, 9850, 0, 3.9, -2.8],
-    ["Round 2", "Hardware", 18020,17590,16980,16980,"Vendor C",17590,"Vendor B", 3.6, 17590, 2.4, 0, -3.5],
-
-    ["Round 3", "Software", 14530,15210,13960,13960,"Vendor C",14530,"Vendor A", 4.1, 14530, 0, 4.7, -3.9],
-    ["Round 3", "Hardware", 31080,29840,28590,28590,"Vendor C",29840,"Vendor B", 4.4, 29840, 4.2, 0, -4.2],
-
-    ["Round 4", "Software", 13420,12090,11560,11560,"Vendor C",12090,"Vendor B", 4.6, 12090, 11, 0, -4.4],
-    ["Round 4", "Hardware", 19570,27840,26510,19570,"Vendor A",26510,"Vendor C", 35.5, 26510, -26.2, 5, 0],
-]
-df_analysis = pd.DataFrame(data, columns=columns)
-
-num_cols = ["Vendor A", "Vendor B", "Vendor C", "1st Lowest", "2nd Lowest", "Median Price"]
-format_dic = {col: format_rupiah for col in num_cols}
+num_cols = vendor_cols + ["1st Lowest", "2nd Lowest", "Median Price"]
+format_dic = rupiah_formatters(df_analysis, num_cols)
 format_dic.update({"Gap 1 to 2 (%)": "{:.1f}%"})
 
-vendor_cols = ["Vendor A", "Vendor B", "Vendor C"]
 for v in vendor_cols:
     format_dic[f"{v} to Median (%)"] = "{:+.1f}%"
 
 df_analysis_styled = (
     df_analysis.style
     .format(format_dic)
-    .apply(lambda row: highlight_1st_2nd(row, df_analysis.columns), axis=1)
+    .pipe(styling.highlight_1st_2nd)
 )
 
 st.dataframe(df_analysis_styled, hide_index=True)
+metrics.mark("bid & price analysis")
 
 st.write("")
 st.markdown("**:blue-badge[5. PRICE MOVEMENT ANALYSIS]**")
@@ -661,38 +562,24 @@ st.markdown(
 )
 
 # DataFrame
-columns = ["VENDOR", "TCO Component", "Round 1", "Round 2", "Round 3", "Round 4", "PRICE REDUCTION (VALUE)", "PRICE REDUCTION (%)", "PRICE TREND", "STANDARD DEVIATION", "PRICE STABILITY INDEX (%)"]
-data = [
-    ["Vendor A", "Hardware", 25000,18020,31080,19570,5430,21.7,"Fluctuating",5127.2428,55.8],
-    ["Vendor A", "Software", 12000,9850,14530,13420,-1420,-11.8,"Fluctuating",1748.5565,37.6],
-    ["Vendor A", "TOTAL", 37000,27870,45610,32990,"","","","",""],
-
-    ["Vendor B", "Hardware", 24000,17590,29840,27840,-3840,-16,"Fluctuating",4670.8156,49.4],
-    ["Vendor B", "Software", 13500,10230,15210,12090,1410,10.4,"Fluctuating",1830.292,39],
-    ["Vendor B", "TOTAL", 37500,27820,45050,39930,"","","","",""],
-
-    ["Vendor C", "Hardware", 23000,16980,28590,26510,-3510,-15.3,"Fluctuating",4399.9148,48.8],
-    ["Vendor C", "Software", 11000,9570,13960,11560,-560,-5.1,"Fluctuating",1583.3568,38.1],
-    ["Vendor C", "TOTAL", 34000,26550,42550,38070,"","","","",""],
-]
-
-df_pmove = pd.DataFrame(data, columns=columns)
-df_pmove = df_pmove.map(lambda x: None if x == "" else x)
-
-num_cols = ["Round 1", "Round 2", "Round 3", "Round 4", "PRICE REDUCTION (VALUE)", "STANDARD DEVIATION"]
-format_dict = {col: format_rupiah for col in num_cols}
-format_dict.update({
-    "PRICE REDUCTION (%)": "{:+.1f}%",
-    "PRICE STABILITY INDEX (%)": "{:.1f}%"
-})
-
-df_pmove_styled = (
-    df_pmove.style
-    .format(format_dict)
-    .apply(highlight_total, axis=1)
-)
+df_pmove = tables["Price Movement Analysis"]
+
+round_cols = list(df_summary["ROUND"].unique())
+pmove_num_cols = round_cols + ["PRICE REDUCTION (VALUE)", "STANDARD DEVIATION"]
+def style_pmove(window):
+    format_dict = rupiah_formatters(window, pmove_num_cols)
+    format_dict.update({
+        "PRICE REDUCTION (%)": "{:+.1f}%",
+        "PRICE STABILITY INDEX (%)": "{:.1f}%"
+    })
+    return (
+        window.style
+        .format(format_dict, na_rep="")
+        .pipe(styling.highlight_total)
+    )
 
-st.dataframe(df_pmove_styled, hide_index=True)
+table_view.windowed_dataframe(df_pmove, style_pmove, key="pmove")
+metrics.mark("price movement")
 
 st.write("")
 st.markdown("**:violet-badge[6. VISUALIZATION]**")
@@ -711,7 +598,7 @@ st.markdown(
 tab1, tab2 = st.tabs(["Winning Performance", "Price Trend"])
 
 with tab1:
-    st.image("assets/1.png")
+    st.vega_lite_chart(charts.win_chart_spec(df_analysis), width="stretch")
     with st.expander("See explanation"):
             st.caption('''
                 The visualization above shows the number of wins each vendor
@@ -735,7 +622,7 @@ with tab1:
             ''')
 
 with tab2:
-    st.image("assets/2.png")
+    st.vega_lite_chart(charts.trend_chart_spec(df_pmove), width="stretch")
     with st.expander("See explanation"):
             st.caption('''
                 The chart above shows the number of occurrences of each **Price 
@@ -752,7 +639,8 @@ with tab2:
                 - Fluctuating  
                      The vendor's price moves up and down across the rounds.
             ''')
-    
+metrics.mark("charts")
+
 st.write("")
 st.markdown("**:gray-badge[7. SUPER BUTTON]**")
 st.markdown(
@@ -775,139 +663,32 @@ dataframes = {
     "Price Movement Analysis": df_pmove,
 }
 
-# Tampilkan multiselect
-selected_sheets = st.multiselect(
-    "Select sheets to download in a single Excel file:",
-    options=list(dataframes.keys()),
-    default=list(dataframes.keys())  # default semua dipilih
-)
-
-# Fungsi "Super Button" & Formatting
-def generate_multi_sheet_excel(selected_sheets, df_dict):
-
-    output = BytesIO()
-
-    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-        for sheet in selected_sheets:
-            df_raw = df_dict[sheet].copy()
-
-            # ===== COERCE NUMERIC SAFELY =====
-            df = df_raw.copy()
-            numeric_cols = []
-
-            for col in df.columns:
-                coerced = pd.to_numeric(df[col], errors="coerce")
-                if coerced.notna().any():
-                    df[col] = coerced
-                    numeric_cols.append(col)
-
-            pct_cols = [c for c in df.columns if "%" in c]
-
-            df.to_excel(writer, index=False, sheet_name=sheet)
-            workbook  = writer.book
-            worksheet = writer.sheets[sheet]
-
-            # ===== FORMAT =====
-            fmt_rupiah = workbook.add_format({"num_format": "#,##0"})
-            fmt_pct    = workbook.add_format({'num_format': '#,##0.0"%"'})
-
-            fmt_total = workbook.add_format({
-                "bold": True,
-                "bg_color": "#D9EAD3",
-                "font_color": "#1A5E20",
-                "num_format": "#,##0"
-            })
-
-            fmt_first = workbook.add_format({
-                "bg_color": "#C6EFCE",
-                "num_format": "#,##0"
-            })
-
-            fmt_second = workbook.add_format({
-                "bg_color": "#FFEB9C",
-                "num_format": "#,##0"
-            })
-
-            # ===== COLUMN FORMAT =====
-            for col_idx, col_name in enumerate(df.columns):
-                if col_name in numeric_cols:
-                    worksheet.set_column(col_idx, col_idx, 15, fmt_rupiah)
-                if col_name in pct_cols:
-                    worksheet.set_column(col_idx, col_idx, 15, fmt_pct)
-
-            # ===== LOOP DATA =====
-            for row_idx, row in enumerate(df.itertuples(index=False), start=1):
-
-                is_total_row = any(
-                    isinstance(x, str) and x.strip().upper() == "TOTAL"
-                    for x in row
-                    if pd.notna(x)
-                )
-
-                # Bid & Price vendor index
-                first_idx = second_idx = None
-                if sheet == "Bid & Price Analysis":
-                    first_vendor  = row[df.columns.get_loc("1st Vendor")]
-                    second_vendor = row[df.columns.get_loc("2nd Vendor")]
-
-                    if first_vendor in numeric_cols:
-                        first_idx = df.columns.get_loc(first_vendor)
-                    if second_vendor in numeric_cols:
-                        second_idx = df.columns.get_loc(second_vendor)
-
-                for col_idx, col_name in enumerate(df.columns):
-                    value = row[col_idx]
-                    fmt = None
-
-                    # ===== PICK FORMAT =====
-                    if sheet == "Bid & Price Analysis":
-                        if col_idx == first_idx:
-                            fmt = fmt_first
-                        elif col_idx == second_idx:
-                            fmt = fmt_second
-                    elif is_total_row:
-                        fmt = fmt_total
-
-                    # ===== WRITE CELL (TYPE SAFE) =====
-                    if pd.isna(value) or (isinstance(value, float) and np.isinf(value)):
-                        worksheet.write_blank(row_idx, col_idx, None, fmt)
-
-                    elif col_name in pct_cols:
-                        worksheet.write_number(
-                            row_idx, col_idx, value, fmt or fmt_pct
-                        )
-
-                    elif col_name in numeric_cols:
-                        worksheet.write_number(
-                            row_idx, col_idx, value, fmt or fmt_rupiah
-                        )
-
-                    else:
-                        worksheet.write(row_idx, col_idx, value, fmt)
-
-            # ===== AUTOFIT =====
-            for i, col in enumerate(df.columns):
-                worksheet.set_column(
-                    i, i,
-                    max(len(str(col)), df[col].astype(str).map(len).max()) + 2
-                )
-
-    output.seek(0)
-    return output.getvalue()
-
-# ---- DOWNLOAD BUTTON ----
-if selected_sheets:
-    excel_bytes = generate_multi_sheet_excel(selected_sheets, dataframes)
-
-    st.download_button(
-        label="Download",
-        data=excel_bytes,
-        file_name="Super Botton - TCO Comparison Round by Round.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        type="primary",
-        use_container_width=True,
+# Super Button sebagai fragment: ganti pilihan sheet cuma menjalankan ulang
+# bagian ini, bukan seluruh halaman (markdown, tabel, grafik)
+@st.fragment
+def super_button(dataframes):
+    # Tampilkan multiselect
+    selected_sheets = st.multiselect(
+        "Select sheets to download in a single Excel file:",
+        options=list(dataframes.keys()),
+        default=list(dataframes.keys())  # default semua dipilih
     )
 
+    # ---- DOWNLOAD BUTTON ----
+    # workbook baru dibuat saat tombol diklik, hasilnya di-cache per isi + urutan sheet
+    if selected_sheets:
+        st.download_button(
+            label="Download",
+            data=partial(cached_multi_sheet_excel, list(selected_sheets), dataframes),
+            file_name="Super Botton - TCO Comparison Round by Round.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            type="primary",
+            use_container_width=True,
+        )
+
+super_button(dataframes)
+metrics.mark("super button")
+
 st.write("")
 st.divider()
 
@@ -923,4 +704,10 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-st.video("https://youtu.be/QcJe9ZrD-Bo?si=Ob07DiDb3_95XKiB")
\ No newline at end of file
+st.video("https://youtu.be/QcJe9ZrD-Bo?si=Ob07DiDb3_95XKiB")
+metrics.mark("video")
+record = metrics.finish()
+
+# Panel waktu tersembunyi, hanya kalau URL-nya ?debug=timing
+if st.query_params.get("debug") == "timing":
+    metrics.debug_panel(record)
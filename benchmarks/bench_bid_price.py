@@ -0,0 +1,65 @@
+"""tco.bid_price_analysis pada matriks harga besar (scope × vendor).
+
+Jalankan dari root repo:  python -m benchmarks.bench_bid_price [rows] [vendors]
+Default 1_000_000 × 50 (butuh ± 2.5 GB RAM). Pembandingnya sort penuh per
+baris (np.sort + nanmedian), cara lama sebelum lowest_two/row_median.
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import tco
+
+def make_merge(n_rows, n_vendors, seed=0):
+    rng = np.random.default_rng(seed)
+    vendor_cols = [f"Vendor {v + 1}" for v in range(n_vendors)]
+    # harga dibulatkan ke ribuan supaya banyak yang kembar
+    prices = rng.integers(1, 5_000, (n_rows, n_vendors)).astype(float) * 1_000
+    prices[rng.random(prices.shape) < 0.05] = np.nan
+    df = pd.DataFrame(prices, columns=vendor_cols)
+    df.insert(0, "TCO Component", "Component")
+    df.insert(0, "Scope", np.arange(n_rows).astype(str))
+    df.insert(0, tco.ROUND, "Round 1")
+    return df, ["Scope", "TCO Component"], vendor_cols
+
+def full_sort(prices):
+    # referensi: sort penuh tiap baris lalu nanmedian
+    ordered = np.sort(prices, axis=1)
+    with np.errstate(invalid="ignore"):
+        median = np.nanmedian(prices, axis=1)
+    return ordered[:, 0], ordered[:, 1], median
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_vendors = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    df, key_cols, vendor_cols = make_merge(n_rows, n_vendors)
+
+    # tabel lengkap dulu, lalu dibuang supaya perbandingan di bawah muat di RAM
+    t0 = time.perf_counter()
+    n_out_cols = tco.bid_price_analysis(df, key_cols, vendor_cols).shape[1]
+    t_table = time.perf_counter() - t0
+
+    prices = df[vendor_cols].to_numpy()
+    t0 = time.perf_counter()
+    filled, first_idx, second_idx = tco.lowest_two(prices)
+    median = tco.row_median(filled, np.isfinite(prices).sum(axis=1))
+    t_core = time.perf_counter() - t0
+    del filled
+
+    t0 = time.perf_counter()
+    ref_first, ref_second, ref_median = full_sort(prices)
+    t_sort = time.perf_counter() - t0
+    rows = np.arange(n_rows)
+    assert np.array_equal(prices[rows, first_idx], ref_first, equal_nan=True)
+    assert np.array_equal(np.where(np.isnan(ref_second), np.nan, prices[rows, second_idx]), ref_second, equal_nan=True)
+    assert np.allclose(median, ref_median, equal_nan=True)
+
+    print(f"{n_rows} rows × {n_vendors} vendors")
+    print(f"  lowest_two + row_median : {t_core:6.2f}s")
+    print(f"  np.sort + nanmedian     : {t_sort:6.2f}s")
+    print(f"  bid_price_analysis      : {t_table:6.2f}s  ({n_out_cols} kolom)")
+
+if __name__ == "__main__":
+    main()
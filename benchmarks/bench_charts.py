@@ -0,0 +1,46 @@
+"""Grafik Visualization: ringkasan data + spec Vega-Lite pada 100k+ scope.
+
+Jalankan dari root repo:  python -m benchmarks.bench_charts
+"aggregate" = win_counts/trend_counts dari tabel hasil, "spec cold" =
+ringkasan + Altair to_dict (cache kosong), "spec cached" = panggilan ulang
+dengan data yang sama. Kolom "points" = jumlah baris data di spec.
+"""
+import json
+import time
+
+import charts
+import tco
+from benchmarks.synthetic import make_rounds
+
+SCALES = [
+    # (scope rows, vendors, rounds)
+    (10_000, 10, 4),
+    (100_000, 10, 4),
+    (100_000, 20, 8),
+]
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
+
+def main():
+    print(f"{'scope':>7} {'vendor':>6} {'round':>5} {'chart':>7} | {'aggregate':>9} {'spec cold':>9} {'cached':>8} | {'points':>6} {'spec KB':>7}")
+    for n_scope, n_vendors, n_rounds in SCALES:
+        tables = tco.build_tables(make_rounds(n_scope, n_vendors, n_rounds))
+        cases = [
+            ("wins", charts.win_counts, charts.win_chart_spec, tables["Bid & Price Analysis"]),
+            ("trends", charts.trend_counts, charts.trend_chart_spec, tables["Price Movement Analysis"]),
+        ]
+        for name, aggregate, chart_spec, df in cases:
+            charts.spec_cache.clear()
+            data, t_agg = timed(aggregate, df)
+            spec, t_cold = timed(chart_spec, df)
+            _, t_cached = timed(chart_spec, df)
+            print(
+                f"{n_scope:>7} {n_vendors:>6} {n_rounds:>5} {name:>7} | {t_agg * 1e3:>7.1f}ms "
+                f"{t_cold * 1e3:>7.1f}ms {t_cached * 1e3:>6.1f}ms | {len(data):>6} {len(json.dumps(spec)) / 1024:>7.1f}"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Cold start halaman: waktu sampai first paint dan sampai halaman selesai.
+
+Jalankan dari root repo:  python -m benchmarks.bench_coldstart
+Tiap mode = server `streamlit run app.py` baru (proses baru, modul belum
+di-import), lalu satu client websocket membuka halaman. first paint = kirim
+rerun sampai elemen pertama diterima; selesai = sampai script_finished.
+  cold      cache parse & table_store kosong (container baru)
+  warm      table_store sudah terisi dari server sebelumnya
+  snapshot  TCO_SNAPSHOT=1, tabel & spec grafik dari snapshot/
+Snapshot dibuat dulu kalau belum ada (python coldstart.py build).
+"""
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+import coldstart
+from benchmarks.bench_fragments import PORT, cpu_seconds, start_server
+
+REPEATS = 3
+
+async def open_page():
+    uri = f"ws://localhost:{PORT}/_stcore/stream"
+    async with websockets.connect(uri, max_size=None, subprotocols=["streamlit"]) as ws:
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        t0 = time.perf_counter()
+        await ws.send(msg.SerializeToString())
+        first_paint = None
+        while True:
+            fm = ForwardMsg()
+            fm.ParseFromString(await ws.recv())
+            kind = fm.WhichOneof("type")
+            if first_paint is None and kind == "delta" and fm.delta.WhichOneof("type") == "new_element":
+                first_paint = time.perf_counter() - t0
+            if kind == "script_finished":
+                return first_paint, time.perf_counter() - t0
+
+def cold_start(env):
+    server = start_server(env=env)
+    try:
+        c0 = cpu_seconds(server.pid)
+        first_paint, done = asyncio.run(open_page())
+        return first_paint, done, cpu_seconds(server.pid) - c0
+    finally:
+        server.terminate()
+        server.wait()
+
+def main():
+    if not os.path.isdir(coldstart.SNAPSHOT_DIR):
+        coldstart.build_snapshot(coldstart.DEMO_FILES)
+
+    print(f"{'mode':>9} | {'first paint':>11} | {'page done':>9} | {'server cpu':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        modes = {
+            "cold": lambda i: {"TCO_TABLE_STORE_DIR": os.path.join(tmp, f"tables{i}"),
+                               "TCO_PARSE_CACHE_DIR": os.path.join(tmp, f"parse{i}")},
+            "warm": lambda i: {"TCO_TABLE_STORE_DIR": os.path.join(tmp, "tables0"),
+                               "TCO_PARSE_CACHE_DIR": os.path.join(tmp, "parse0")},
+            "snapshot": lambda i: {"TCO_SNAPSHOT": "1",
+                                   "TCO_TABLE_STORE_DIR": os.path.join(tmp, f"snap-tables{i}"),
+                                   "TCO_PARSE_CACHE_DIR": os.path.join(tmp, f"snap-parse{i}")},
+        }
+        for mode, extra in modes.items():
+            runs = [cold_start({**os.environ, "TCO_SNAPSHOT": "0", **extra(i)}) for i in range(REPEATS)]
+            first_paint, done, cpu = (statistics.median(values) for values in zip(*runs))
+            print(f"{mode:>9} | {first_paint * 1e3:>9.0f}ms | {done * 1e3:>7.0f}ms | {cpu * 1e3:>8.0f}ms")
+
+if __name__ == "__main__":
+    main()
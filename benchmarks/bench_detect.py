@@ -0,0 +1,66 @@
+"""Deteksi floating table: materialisasi seluruh sheet vs stream_table.
+
+Jalankan dari root repo:  python -m benchmarks.bench_detect
+"""
+import tempfile
+import time
+import tracemalloc
+
+import openpyxl
+import pandas as pd
+
+import ingest
+from benchmarks.synthetic import write_round_files
+
+CASES = [
+    # (scope rows, vendors, offset, baris kosong berformat di bawah tabel)
+    (500, 10, (2, 1), 0),
+    (500, 10, (200, 30), 0),
+    (500, 10, (2, 1), 50_000),
+    (500, 10, (200, 30), 200_000),
+]
+
+def locate_table(raw):
+    # cara lama (dulu tco.locate_table): buang baris/kolom kosong di atas &
+    # kiri tabel, baris pertama yang tersisa jadi header
+    raw = raw.dropna(how="all").dropna(axis=1, how="all")
+    if raw.empty:
+        raise ValueError("No table found in sheet")
+    header = [str(c).strip() for c in raw.iloc[0]]
+    table = raw.iloc[1:].reset_index(drop=True)
+    table.columns = header
+    return table
+
+def materialise(path):
+    # cara lama: seluruh used range jadi DataFrame, lalu dicari tabelnya
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        raw = pd.DataFrame(list(wb.worksheets[0].iter_rows(values_only=True)))
+    finally:
+        wb.close()
+    return locate_table(raw)
+
+def measure(fn, path):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    table = fn(path)
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return table, elapsed, peak / 2**20
+
+def main():
+    print(f"{'scope':>6} {'offset':>10} {'trailing':>9} | {'full time':>9} {'full MiB':>9} | {'stream time':>11} {'stream MiB':>10}")
+    for n_scope, n_vendors, offset, trailing in CASES:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_round_files(tmp, 1, n_vendors, n_scope, offset=offset, trailing_rows=trailing)[0]
+            full, t_full, m_full = measure(materialise, path)
+            table, t_stream, m_stream = measure(ingest.read_table, path)
+        assert table.shape == full.shape == (n_scope, n_vendors + 2)
+        print(
+            f"{n_scope:>6} {str(offset):>10} {trailing:>9} | "
+            f"{t_full:>8.3f}s {m_full:>9.1f} | {t_stream:>10.3f}s {m_stream:>10.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
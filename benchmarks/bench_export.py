@@ -0,0 +1,182 @@
+"""generate_multi_sheet_excel: loop per cell (lama) vs tulis per kolom.
+
+Halaman memakai penulis per kolom ini untuk workbook di bawah
+export.IN_MEMORY_CELLS; di atas itu lihat bench_export_stream dan
+bench_export_parallel.
+
+Jalankan dari root repo:  python -m benchmarks.bench_export
+"""
+import time
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from export import generate_multi_sheet_excel
+
+# target throughput Cost Summary (baris/detik) untuk jalur baru. Batas
+# atasnya xlsxwriter sendiri: serialisasi XML saat close() saja sudah
+# ~3 detik per 100k baris × 4 kolom
+TARGET_ROWS_PER_SEC = 15_000
+
+def make_cost_summary(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    n_vendors = 10
+    vendor = np.array([f"Vendor {i + 1}" for i in range(n_vendors)])
+    component = np.where(np.arange(n_rows) % 3 == 2, "TOTAL", "Scope")
+    return pd.DataFrame({
+        "ROUND": [f"Round {i // (n_rows // 4 or 1) + 1}" for i in range(n_rows)],
+        "VENDOR": vendor[np.arange(n_rows) % n_vendors],
+        "TCO Component": component,
+        "PRICE": rng.integers(1_000, 50_000_000, n_rows),
+    })
+
+def make_bid_price(n_rows, n_vendors=5, seed=0):
+    rng = np.random.default_rng(seed)
+    vendors = [f"Vendor {i + 1}" for i in range(n_vendors)]
+    prices = rng.integers(1_000, 50_000_000, (n_rows, n_vendors)).astype(float)
+    order = np.argsort(prices, axis=1)
+    df = pd.DataFrame(prices, columns=vendors)
+    df.insert(0, "TCO Component", [f"Scope {i}" for i in range(n_rows)])
+    df["1st Vendor"] = np.array(vendors)[order[:, 0]]
+    df["2nd Vendor"] = np.array(vendors)[order[:, 1]]
+    df["Gap 1 to 2 (%)"] = rng.random(n_rows) * 10
+    return df
+
+# implementasi lama (sebelum tulis per kolom), untuk pembanding
+def legacy_generate_multi_sheet_excel(selected_sheets, df_dict):
+
+    output = BytesIO()
+
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
+        for sheet in selected_sheets:
+            df_raw = df_dict[sheet].copy()
+
+            # ===== COERCE NUMERIC SAFELY =====
+            df = df_raw.copy()
+            numeric_cols = []
+
+            for col in df.columns:
+                coerced = pd.to_numeric(df[col], errors="coerce")
+                if coerced.notna().any():
+                    df[col] = coerced
+                    numeric_cols.append(col)
+
+            pct_cols = [c for c in df.columns if "%" in c]
+
+            df.to_excel(writer, index=False, sheet_name=sheet)
+            workbook  = writer.book
+            worksheet = writer.sheets[sheet]
+
+            # ===== FORMAT =====
+            fmt_rupiah = workbook.add_format({"num_format": "#,##0"})
+            fmt_pct    = workbook.add_format({'num_format': '#,##0.0"%"'})
+
+            fmt_total = workbook.add_format({
+                "bold": True,
+                "bg_color": "#D9EAD3",
+                "font_color": "#1A5E20",
+                "num_format": "#,##0"
+            })
+
+            fmt_first = workbook.add_format({
+                "bg_color": "#C6EFCE",
+                "num_format": "#,##0"
+            })
+
+            fmt_second = workbook.add_format({
+                "bg_color": "#FFEB9C",
+                "num_format": "#,##0"
+            })
+
+            # ===== COLUMN FORMAT =====
+            for col_idx, col_name in enumerate(df.columns):
+                if col_name in numeric_cols:
+                    worksheet.set_column(col_idx, col_idx, 15, fmt_rupiah)
+                if col_name in pct_cols:
+                    worksheet.set_column(col_idx, col_idx, 15, fmt_pct)
+
+            # ===== LOOP DATA =====
+            for row_idx, row in enumerate(df.itertuples(index=False), start=1):
+
+                is_total_row = any(
+                    isinstance(x, str) and x.strip().upper() == "TOTAL"
+                    for x in row
+                    if pd.notna(x)
+                )
+
+                # Bid & Price vendor index
+                first_idx = second_idx = None
+                if sheet == "Bid & Price Analysis":
+                    first_vendor  = row[df.columns.get_loc("1st Vendor")]
+                    second_vendor = row[df.columns.get_loc("2nd Vendor")]
+
+                    if first_vendor in numeric_cols:
+                        first_idx = df.columns.get_loc(first_vendor)
+                    if second_vendor in numeric_cols:
+                        second_idx = df.columns.get_loc(second_vendor)
+
+                for col_idx, col_name in enumerate(df.columns):
+                    value = row[col_idx]
+                    fmt = None
+
+                    # ===== PICK FORMAT =====
+                    if sheet == "Bid & Price Analysis":
+                        if col_idx == first_idx:
+                            fmt = fmt_first
+                        elif col_idx == second_idx:
+                            fmt = fmt_second
+                    elif is_total_row:
+                        fmt = fmt_total
+
+                    # ===== WRITE CELL (TYPE SAFE) =====
+                    if pd.isna(value) or (isinstance(value, float) and np.isinf(value)):
+                        worksheet.write_blank(row_idx, col_idx, None, fmt)
+
+                    elif col_name in pct_cols:
+                        worksheet.write_number(
+                            row_idx, col_idx, value, fmt or fmt_pct
+                        )
+
+                    elif col_name in numeric_cols:
+                        worksheet.write_number(
+                            row_idx, col_idx, value, fmt or fmt_rupiah
+                        )
+
+                    else:
+                        worksheet.write(row_idx, col_idx, value, fmt)
+
+            # ===== AUTOFIT =====
+            for i, col in enumerate(df.columns):
+                worksheet.set_column(
+                    i, i,
+                    max(len(str(col)), df[col].astype(str).map(len).max()) + 2
+                )
+
+    output.seek(0)
+    return output.getvalue()
+
+def rows_per_sec(fn, n_rows):
+    t0 = time.perf_counter()
+    fn()
+    return n_rows / (time.perf_counter() - t0)
+
+def main():
+    print(f"{'sheet':<14} {'rows':>8} | {'legacy rows/s':>13} {'bulk rows/s':>12} {'speedup':>8}")
+    for n_rows in [10_000, 100_000]:
+        sheets = {
+            "Cost Summary": make_cost_summary(n_rows),
+            "Bid & Price Analysis": make_bid_price(n_rows),
+        }
+        for name, df in sheets.items():
+            one = {name: df}
+            old = rows_per_sec(lambda: legacy_generate_multi_sheet_excel([name], one), n_rows)
+            new = rows_per_sec(lambda: generate_multi_sheet_excel([name], one), n_rows)
+            print(f"{name[:14]:<14} {n_rows:>8} | {old:>13,.0f} {new:>12,.0f} {new / old:>7.1f}x")
+
+            if name == "Cost Summary" and n_rows == 100_000:
+                status = "OK" if new >= TARGET_ROWS_PER_SEC else "BELOW TARGET"
+                print(f"  target {TARGET_ROWS_PER_SEC:,} rows/s: {status}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Super Button 5 sheet: satu proses vs sheet paralel (1/2/4/8 worker).
+
+Jalankan dari root repo:  python -m benchmarks.bench_export_parallel
+Tabel dibuat dari round sintetis lewat tco.build_tables. Speedup dibatasi
+jumlah CPU dan sheet terbesar (Cost Summary), karena satu sheet tetap
+ditulis oleh satu worker. Pembanding "serial" adalah
+spooled_multi_sheet_excel, jalur satu proses halaman untuk workbook sebesar
+ini.
+"""
+import os
+import time
+
+import export
+import tco
+from benchmarks.synthetic import make_rounds
+
+WORKERS = [1, 2, 4, 8]
+
+def main():
+    tables = tco.build_tables(make_rounds(2_000, 10, 4))
+    sheets = list(tables)
+    cells = sum(df.size for df in tables.values())
+    print(f"cpu: {os.cpu_count()}, {len(sheets)} sheets, {cells:,} cells")
+
+    t0 = time.perf_counter()
+    export.spooled_multi_sheet_excel(sheets, tables).close()
+    t_serial = time.perf_counter() - t0
+    print(f"{'serial':>10} | {t_serial:>6.2f}s")
+
+    for workers in WORKERS:
+        t0 = time.perf_counter()
+        export.parallel_multi_sheet_excel(sheets, tables, workers=workers).close()
+        t_par = time.perf_counter() - t0
+        print(f"{workers:>3} worker | {t_par:>6.2f}s {t_serial / t_par:>5.2f}x")
+
+if __name__ == "__main__":
+    main()
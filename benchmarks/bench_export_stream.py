@@ -0,0 +1,66 @@
+"""Peak memory export: BytesIO (generate_multi_sheet_excel) vs streaming.
+
+Jalankan dari root repo:  python -m benchmarks.bench_export_stream
+Tiap ukuran dijalankan di proses baru; "peak" = kenaikan RSS maksimum
+selama export dibanding sesudah data dibuat. Mode streaming
+(spooled_multi_sheet_excel) menulis dengan constant_memory ke temp file,
+jadi peak-nya hampir tidak ikut naik dengan jumlah baris.
+"""
+import gc
+import json
+import resource
+import subprocess
+import sys
+import time
+
+import export
+from benchmarks.bench_export import make_bid_price, make_cost_summary
+
+ROWS = [50_000, 200_000, 400_000]
+
+def peak_rss():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def current_rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize()
+
+def child(mode, n_rows):
+    df_dict = {
+        "Cost Summary": make_cost_summary(n_rows),
+        "Bid & Price Analysis": make_bid_price(n_rows // 4),
+    }
+    gc.collect()
+    base = current_rss()
+    t0 = time.perf_counter()
+    if mode == "bytesio":
+        size = len(export.generate_multi_sheet_excel(list(df_dict), df_dict))
+    else:
+        output = export.spooled_multi_sheet_excel(list(df_dict), df_dict)
+        size = output.seek(0, 2)
+        output.close()
+    print(json.dumps({
+        "seconds": time.perf_counter() - t0,
+        "peak": max(peak_rss() - base, 0),
+        "bytes": size,
+    }))
+
+def main():
+    print(f"{'rows':>8} | {'mode':>8} {'time':>7} {'peak RSS':>10} {'xlsx':>9}")
+    for n_rows in ROWS:
+        for mode in ("bytesio", "stream"):
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_export_stream", "--child", mode, str(n_rows)],
+                check=True, capture_output=True, text=True,
+            )
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            print(
+                f"{n_rows:>8} | {mode:>8} {r['seconds']:>6.1f}s "
+                f"{r['peak'] / 2**20:>7.0f}MiB {r['bytes'] / 2**20:>6.1f}MiB"
+            )
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
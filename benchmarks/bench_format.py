@@ -0,0 +1,61 @@
+"""format_rupiah per-cell vs format_rupiah_series / rupiah_formatter.
+
+Jalankan dari root repo:  python -m benchmarks.bench_format
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from formatting import format_rupiah, format_rupiah_series, rupiah_formatters
+
+def make_table(n_rows, n_vendors, seed=0):
+    rng = np.random.default_rng(seed)
+    data = {"TCO Component": [f"Scope {i}" for i in range(n_rows)]}
+    for v in range(n_vendors):
+        prices = rng.integers(1_000, 50_000_000, n_rows).astype(float)
+        # sebagian harga punya desimal, sebagian kosong (vendor tidak bid)
+        has_cents = rng.random(n_rows) < 0.2
+        prices[has_cents] += rng.random(has_cents.sum()).round(2)
+        prices[rng.random(n_rows) < 0.05] = np.nan
+        data[f"Vendor {v + 1}"] = prices
+    return pd.DataFrame(data)
+
+def timeit(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def render(styler):
+    styler._compute()
+    return styler._translate(False, False)
+
+def main():
+    print(f"{'rows':>8} {'vendors':>8} {'cells':>10} | {'per-cell':>9} {'series':>9} {'speedup':>8} | {'styler old':>10} {'styler new':>10}")
+    for n_rows, n_vendors in [(1_000, 12), (10_000, 24), (50_000, 36)]:
+        df = make_table(n_rows, n_vendors)
+        num_cols = list(df.columns[1:])
+
+        t_cell = timeit(lambda: [df[c].map(format_rupiah) for c in num_cols])
+        t_series = timeit(lambda: [format_rupiah_series(df[c]) for c in num_cols])
+
+        # pastikan hasilnya identik
+        for c in num_cols:
+            assert df[c].map(format_rupiah).equals(format_rupiah_series(df[c])), c
+
+        # jalur yang sama dengan st.dataframe(styler): _compute + _translate
+        head = df.head(5_000)
+        t_sty_old = timeit(lambda: render(head.style.format({c: format_rupiah for c in num_cols})), repeat=1)
+        t_sty_new = timeit(lambda: render(head.style.format(rupiah_formatters(head, num_cols))), repeat=1)
+
+        print(
+            f"{n_rows:>8} {n_vendors:>8} {n_rows * n_vendors:>10} | "
+            f"{t_cell:>8.3f}s {t_series:>8.3f}s {t_cell / t_series:>7.1f}x | "
+            f"{t_sty_old:>9.3f}s {t_sty_new:>9.3f}s"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Latensi & CPU server per interaksi: rerun seluruh script vs rerun fragment.
+
+Jalankan dari root repo:  python -m benchmarks.bench_fragments
+Menjalankan `streamlit run app.py` sungguhan, lalu jadi client websocket
+(protokol BackMsg/ForwardMsg Streamlit). Tiap interaksi dikirim dua kali:
+tanpa fragment_id (rerun seluruh halaman, perilaku sebelum ada fragment)
+dan dengan fragment_id widget-nya (rerun fragment saja). Waktu = kirim
+sampai script_finished; CPU = utime+stime proses server (dari /proc).
+"""
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+PORT = 8599
+REPEATS = 15
+WIDGETS = ("multiselect", "text_input", "number_input")
+
+def start_server(port=PORT, env=None):
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "app.py", "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env,
+    )
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(f"http://localhost:{port}/_stcore/health", timeout=1)
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("streamlit server did not start")
+
+def cpu_seconds(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+class Session:
+    def __init__(self, ws):
+        self.ws = ws
+        self.widgets = {}      # label/key → (type, id, fragment_id)
+
+    async def rerun(self, states=(), fragment_id=""):
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.fragment_id = fragment_id
+        for widget_id, field, value in states:
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            if field == "string_array_value":
+                state.string_array_value.data.extend(value)
+            else:
+                setattr(state, field, value)
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            fm = ForwardMsg()
+            fm.ParseFromString(await self.ws.recv())
+            kind = fm.WhichOneof("type")
+            if kind == "delta" and fm.delta.WhichOneof("type") == "new_element":
+                element = fm.delta.new_element
+                widget_type = element.WhichOneof("type")
+                if widget_type in WIDGETS:
+                    widget = getattr(element, widget_type)
+                    name = widget.id.rsplit("-", 1)[-1]
+                    self.widgets[name if name != "None" else widget_type] = (widget.id, fm.delta.fragment_id)
+            if kind == "script_finished":
+                return
+
+async def measure(session, pid, name, values, field):
+    widget_id, fragment_id = session.widgets[name]
+    results = {}
+    for label, fragment in (("full", ""), ("fragment", fragment_id)):
+        times, cpu = [], []
+        for i in range(REPEATS):
+            state = [(widget_id, field, values[i % len(values)])]
+            c0, t0 = cpu_seconds(pid), time.perf_counter()
+            await session.rerun(state, fragment)
+            times.append(time.perf_counter() - t0)
+            cpu.append(cpu_seconds(pid) - c0)
+        results[label] = (statistics.median(times), statistics.mean(cpu))
+    return results
+
+async def run(pid):
+    uri = f"ws://localhost:{PORT}/_stcore/stream"
+    async with websockets.connect(uri, max_size=None, subprotocols=["streamlit"]) as ws:
+        session = Session(ws)
+        await session.rerun()   # run pertama: tabel & cache dibangun
+        await session.rerun()
+        sheets = ["Merge Data", "Cost Summary", "Pivot Table", "Bid & Price Analysis", "Price Movement Analysis"]
+        cases = [
+            ("Super Button sheets", "multiselect", [sheets[:4], sheets], "string_array_value"),
+            ("Cost Summary search", "summary_search", ["Hardware", ""], "string_value"),
+            ("Merge Data search", "merge_search", ["Round 2", ""], "string_value"),
+        ]
+        print(f"{'interaction':>20} | {'full p50':>9} {'cpu':>8} | {'fragment p50':>12} {'cpu':>8} | {'speedup':>7}")
+        for title, name, values, field in cases:
+            res = await measure(session, pid, name, values, field)
+            (t_full, c_full), (t_frag, c_frag) = res["full"], res["fragment"]
+            print(
+                f"{title:>20} | {t_full * 1e3:>7.0f}ms {c_full * 1e3:>6.0f}ms | "
+                f"{t_frag * 1e3:>10.0f}ms {c_frag * 1e3:>6.0f}ms | {t_full / t_frag:>6.1f}x"
+            )
+
+def main():
+    server = start_server()
+    try:
+        asyncio.run(run(server.pid))
+    finally:
+        server.terminate()
+        server.wait()
+
+if __name__ == "__main__":
+    main()
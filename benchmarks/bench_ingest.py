@@ -0,0 +1,59 @@
+"""Ingestion file round: pd.read_excel berurutan vs ingest.load_rounds.
+
+Jalankan dari root repo:  python -m benchmarks.bench_ingest
+"""
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+import ingest
+import tco
+from benchmarks.bench_detect import locate_table
+from benchmarks.synthetic import write_round_files
+
+SCALES = [
+    # (rounds, vendors, scope rows)
+    (8, 10, 500),
+    (24, 10, 500),
+    (24, 20, 2_000),
+]
+
+def read_excel_sequential(paths):
+    # cara lama: pd.read_excel (openpyxl mode penuh) satu per satu
+    rounds = {}
+    for path in paths:
+        raw = pd.read_excel(path, header=None)
+        rounds[tco.round_name(path)] = tco.clean_round(locate_table(raw))
+    return rounds
+
+def main():
+    workers = os.cpu_count() or 1
+    print(f"cpu: {workers}")
+    print(f"{'rounds':>6} {'vendor':>6} {'scope':>6} | {'read_excel':>10} {'ingest x1':>10} {'ingest xN':>10} | {'slowest file':>12}")
+    for n_rounds, n_vendors, n_scope in SCALES:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = write_round_files(tmp, n_rounds, n_vendors, n_scope)
+
+            t0 = time.perf_counter()
+            read_excel_sequential(paths)
+            t_old = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            ingest.load_rounds(paths, workers=1)
+            t_one = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            _, timings = ingest.load_rounds(paths, workers=workers)
+            t_all = time.perf_counter() - t0
+
+        slowest = max(timings, key=timings.get)
+        print(
+            f"{n_rounds:>6} {n_vendors:>6} {n_scope:>6} | "
+            f"{t_old:>9.2f}s {t_one:>9.2f}s {t_all:>9.2f}s | "
+            f"{slowest} {timings[slowest]:.3f}s"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Load test: banyak session halaman sekaligus lewat AppTest, dari thread pool.
+
+Jalankan dari root repo:  python -m benchmarks.bench_load [--sessions 1,4,16]
+Tiap session = satu AppTest (session state & widget sendiri) yang membuka
+halaman, lalu --steps kali: ganti pilihan sheet di multiselect (rerun) dan
+klik Download, plus satu klik Dummy Dataset (ZIP). Klik = callable
+deferred tombolnya dijalankan dan dijadikan bytes, sama seperti
+MediaFileManager.execute_deferred di server. AppTest selalu rerun seluruh
+script (tidak ada rerun fragment), jadi angka rerun ini batas atas.
+Dilaporkan per jumlah session: p50/p95/p99 latensi per jenis aksi,
+throughput aksi/detik, dan pertambahan RSS proses (diukur selagi semua
+AppTest masih hidup) dibagi jumlah session, plus RSS total.
+Satu run pemanasan dulu supaya table_store & cache proses sudah terisi.
+"""
+import argparse
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from streamlit.runtime import Runtime
+from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import AppTest, app_test, local_script_runner
+
+from table_store import resident_memory
+
+APP = os.path.abspath("app.py")
+SHEETS = ["Merge Data", "Cost Summary", "Pivot Table", "Bid & Price Analysis", "Price Movement Analysis"]
+
+# AppTest.run menaruh runtime palsu di Runtime._instance (global) lalu
+# mengosongkannya di akhir run, jadi session lain yang sedang jalan
+# kehilangan runtime (download_button tidak bisa mendaftarkan callable).
+# Di sini runtime pertama dipakai terus oleh semua session, seperti satu
+# server.
+class _SharedRuntime(type):
+    def __setattr__(cls, name, value):
+        if name == "_instance" and Runtime._instance is None:
+            Runtime._instance = value
+
+class _RuntimeSlot(metaclass=_SharedRuntime):
+    pass
+
+app_test.Runtime = _RuntimeSlot
+
+# Satu ScriptCache (bytecode app.py) untuk semua session, juga seperti
+# server. AppTest membuat cache baru tiap run → app.py di-compile ulang
+# tiap rerun, dan ast.parse dari banyak thread sekaligus bisa gagal di
+# Python 3.11 ("AST constructor recursion depth mismatch")
+script_cache = ScriptCache()
+app_test.ScriptCache = local_script_runner.ScriptCache = lambda: script_cache
+
+# Callable deferred dicatat per file_id (uuid): semua AppTest memakai
+# session id yang sama, jadi di manager-nya callable session lain bisa
+# tertimpa dan dibuang sebagai orphan.
+_deferred = {}
+_deferred_lock = threading.Lock()
+_add_deferred = MediaFileManager.add_deferred
+
+def _record_deferred(self, data_callable, *args, **kwargs):
+    file_id = _add_deferred(self, data_callable, *args, **kwargs)
+    with _deferred_lock:
+        _deferred[file_id] = data_callable
+    return file_id
+
+MediaFileManager.add_deferred = _record_deferred
+
+def download(at, label):
+    button = next(b for b in at.get("download_button") if b.proto.label == label)
+    with _deferred_lock:
+        data_callable = _deferred.pop(button.proto.deferred_file_id)
+    data, _ = convert_data_to_bytes_and_infer_mime(data_callable(), unsupported_error=TypeError())
+    return len(data)
+
+def checked(at):
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return at
+
+def timed(latencies, action, fn):
+    t0 = time.perf_counter()
+    result = fn()
+    latencies.append((action, time.perf_counter() - t0))
+    return result
+
+def session(seed, steps):
+    # → ([(aksi, detik)], AppTest terakhir)
+    rng = random.Random(seed)
+    latencies = []
+    at = timed(latencies, "open", lambda: checked(AppTest.from_file(APP, default_timeout=300).run()))
+    timed(latencies, "zip", lambda: download(at, "Dummy Dataset"))
+    for _ in range(steps):
+        sheets = rng.sample(SHEETS, rng.randint(1, len(SHEETS)))
+        at = timed(latencies, "rerun", lambda: checked(at.multiselect[0].set_value(sheets).run()))
+        timed(latencies, "download", lambda: download(at, "Download"))
+    return latencies, at
+
+def run_level(n_sessions, steps):
+    rss0 = resident_memory()["rss"]
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n_sessions) as pool:
+        results = list(pool.map(session, range(n_sessions), [steps] * n_sessions))
+    wall = time.perf_counter() - t0
+    rss = resident_memory()["rss"]
+
+    by_action = {}
+    for latencies, _ in results:
+        for action, seconds in latencies:
+            by_action.setdefault(action, []).append(seconds)
+    n_actions = sum(len(v) for v in by_action.values())
+    return by_action, n_actions / wall, max(rss - rss0, 0) / n_sessions, rss
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent AppTest sessions against app.py")
+    parser.add_argument("--sessions", default="1,2,4,8", help="comma list of concurrent session counts")
+    parser.add_argument("--steps", type=int, default=5, help="multiselect + download rounds per session")
+    args = parser.parse_args()
+
+    session(-1, 1)  # pemanasan
+    print(f"{'sessions':>8} {'action':>9} | {'p50':>8} {'p95':>8} {'p99':>8} | {'actions/s':>9} {'RSS/session':>11} {'RSS':>9}")
+    for n_sessions in [int(n) for n in args.sessions.split(",")]:
+        by_action, throughput, rss_per_session, rss = run_level(n_sessions, args.steps)
+        for i, action in enumerate(["open", "rerun", "download", "zip"]):
+            p50, p95, p99 = np.percentile(by_action[action], [50, 95, 99]) * 1e3
+            tail = f"{throughput:>9.1f} {rss_per_session / 2**20:>8.1f}MiB {rss / 2**20:>6.0f}MiB" if i == 0 else ""
+            print(f"{n_sessions if i == 0 else '':>8} {action:>9} | {p50:>6.0f}ms {p95:>6.0f}ms {p99:>6.0f}ms | {tail}")
+
+if __name__ == "__main__":
+    main()
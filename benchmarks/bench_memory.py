@@ -0,0 +1,66 @@
+"""Peak memory satu klik Super Button (cache miss), sebelum vs sesudah.
+
+Jalankan dari root repo:  python -m benchmarks.bench_memory
+Tiap ukuran & mode dijalankan di proses baru; "peak" = kenaikan RSS
+maksimum selama export + konversi Streamlit (convert_data_to_bytes, yang
+dipakai download_button) dibanding sesudah tabel dibuat.
+  before  generate_multi_sheet_excel: model cell xlsxwriter di memori,
+          ditulis ke BytesIO (jalur cache miss sebelumnya)
+  after   cached_multi_sheet_excel: constant_memory ke temp file, dibaca
+          sekali jadi bytes untuk cache (>= STREAMING_CELLS: file-nya
+          langsung diberikan ke Streamlit sebagai BufferedReader)
+Tabel dari tco.build_tables (4 round × 10 vendor), sheet Merge Data,
+Bid & Price Analysis, Pivot Table, Price Movement Analysis.
+"""
+import gc
+import json
+import subprocess
+import sys
+import time
+
+from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+import export
+import tco
+from benchmarks.bench_export_stream import current_rss, peak_rss
+from benchmarks.synthetic import make_rounds
+
+SCOPE_ROWS = [1_000, 5_000]
+SHEETS = ["Merge Data", "Bid & Price Analysis", "Pivot Table", "Price Movement Analysis"]
+
+def child(mode, n_scope):
+    tables = tco.build_tables(make_rounds(n_scope, 10, 4))
+    gc.collect()
+    base = current_rss()
+    t0 = time.perf_counter()
+    if mode == "before":
+        data = export.generate_multi_sheet_excel(SHEETS, tables)
+    else:
+        data = export.cached_multi_sheet_excel(SHEETS, tables)
+    data, _ = convert_data_to_bytes_and_infer_mime(data, unsupported_error=TypeError())
+    print(json.dumps({
+        "seconds": time.perf_counter() - t0,
+        "peak": max(peak_rss() - base, 0),
+        "bytes": len(data),
+        "cells": sum(tables[sheet].size for sheet in SHEETS),
+    }))
+
+def main():
+    print(f"{'cells':>9} | {'mode':>6} {'time':>7} {'peak RSS':>10} {'xlsx':>9}")
+    for n_scope in SCOPE_ROWS:
+        for mode in ("before", "after"):
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_memory", "--child", mode, str(n_scope)],
+                check=True, capture_output=True, text=True,
+            )
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            print(
+                f"{r['cells']:>9,} | {mode:>6} {r['seconds']:>6.1f}s "
+                f"{r['peak'] / 2**20:>7.0f}MiB {r['bytes'] / 2**20:>6.1f}MiB"
+            )
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
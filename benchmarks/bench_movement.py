@@ -0,0 +1,65 @@
+"""tco.price_movement pada banyak round.
+
+Jalankan dari root repo:  python -m benchmarks.bench_movement
+Sebagai pembanding ikut dicetak waktu klasifikasi trend per-seri (loop
+Python) pada 2_000 seri pertama. Label trend-nya dicek di tests/test_tco.py.
+"""
+import time
+
+import numpy as np
+
+import tco
+from benchmarks.synthetic import make_rounds
+
+SCALES = [
+    # (scope rows, vendors, rounds)
+    (1_000, 20, 4),
+    (1_000, 20, 36),
+    (1_000, 20, 120),
+    (1_000, 20, 300),
+    (200, 50, 500),
+]
+N_CHECK = 2_000
+
+def trend_loop(series):
+    # referensi: satu seri satu kali loop, round tanpa harga dilewati
+    prices = [p for p in series if np.isfinite(p)]
+    if not prices:
+        return None
+    diffs = [b - a for a, b in zip(prices, prices[1:])]
+    if all(d == 0 for d in diffs):
+        return "No Change"
+    if all(d < 0 for d in diffs):
+        return "Consistently Down"
+    if all(d > 0 for d in diffs):
+        return "Consistently Up"
+    return "Fluctuating"
+
+def main():
+    print(f"{'scope':>6} {'vendor':>6} {'round':>5} | {'movement':>9} {'ns/cell':>8} | {'loop/seri':>10}")
+    for n_scope, n_vendors, n_rounds in SCALES:
+        rounds = make_rounds(n_scope, n_vendors, n_rounds)
+        # sebagian seri dibuat rata supaya semua label muncul
+        for table, _, vendor_cols in list(rounds.values())[1:]:
+            table.loc[::7, vendor_cols] = list(rounds.values())[0][0].loc[::7, vendor_cols]
+        cube = tco.PriceCube(rounds)
+
+        t0 = time.perf_counter()
+        tco.price_movement(cube)
+        t_move = time.perf_counter() - t0
+
+        _, values = cube.by_component()
+        series = values.transpose(2, 1, 0).reshape(-1, values.shape[0])
+        t0 = time.perf_counter()
+        for s in series[:N_CHECK]:
+            trend_loop(s)
+        t_loop = (time.perf_counter() - t0) / min(N_CHECK, len(series))
+
+        cells = n_scope * n_vendors * n_rounds
+        print(
+            f"{n_scope:>6} {n_vendors:>6} {n_rounds:>5} | "
+            f"{t_move:>8.3f}s {t_move / cells * 1e9:>8.0f} | {t_loop * 1e6:>8.0f}µs"
+        )
+
+if __name__ == "__main__":
+    main()
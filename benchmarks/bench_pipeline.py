@@ -0,0 +1,49 @@
+"""Waktu tiap tahap tco.py pada beberapa skala scope × vendor × round.
+
+Jalankan dari root repo:  python -m benchmarks.bench_pipeline
+Kolom "ns/cell" = waktu total dibagi (scope × vendor × round); kalau
+skalanya linear angka ini kurang lebih konstan antar baris.
+"""
+import time
+
+import tco
+from benchmarks.synthetic import make_rounds
+
+SCALES = [
+    # (scope rows, vendors, rounds)
+    (1_000, 10, 4),
+    (4_000, 10, 4),
+    (1_000, 200, 4),
+    (1_000, 10, 36),
+    (2_000, 100, 12),
+    (2_000, 100, 24),
+]
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
+
+def main():
+    stages = ["cube", "merge", "summary", "pivot", "bid&price", "movement"]
+    print(f"{'scope':>6} {'vendor':>6} {'round':>5} | " + " ".join(f"{s:>9}" for s in stages) + f" | {'total':>7} {'ns/cell':>8}")
+    for n_scope, n_vendors, n_rounds in SCALES:
+        rounds = make_rounds(n_scope, n_vendors, n_rounds)
+        cube, t_cube = timed(tco.PriceCube, rounds)
+        df_merge, t_merge = timed(tco.merge_data, cube)
+        _, t_summary = timed(tco.cost_summary, cube)
+        _, t_pivot = timed(tco.pivot_table, cube)
+        _, t_bid = timed(tco.bid_price_analysis, df_merge, cube.key_cols, cube.vendor_cols)
+        _, t_move = timed(tco.price_movement, cube)
+
+        times = [t_cube, t_merge, t_summary, t_pivot, t_bid, t_move]
+        total = sum(times)
+        cells = n_scope * n_vendors * n_rounds
+        print(
+            f"{n_scope:>6} {n_vendors:>6} {n_rounds:>5} | "
+            + " ".join(f"{t:>8.3f}s" for t in times)
+            + f" | {total:>6.2f}s {total / cells * 1e9:>8.0f}"
+        )
+
+if __name__ == "__main__":
+    main()
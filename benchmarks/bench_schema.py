@@ -0,0 +1,45 @@
+"""Memori tabel hasil dan waktu persiapan export: kolom teks object vs category.
+
+Jalankan dari root repo:  python -m benchmarks.bench_schema
+"object" = tabel yang sama dengan kolom teks dikembalikan ke object (tanpa
+schema), jadi export harus menebak ulang tipe tiap kolom lewat pd.to_numeric.
+"""
+import time
+
+import pandas as pd
+
+import export
+import tco
+from benchmarks.synthetic import make_rounds
+
+SCALES = [
+    # (scope rows, vendors, rounds)
+    (1_000, 10, 4),
+    (4_000, 10, 4),
+    (2_000, 100, 12),
+]
+
+def as_object(df):
+    return df.astype({col: object for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)})
+
+def main():
+    print(f"{'scale':>14} {'table':>24} | {'object MB':>9} {'category MB':>11} {'ratio':>6} | {'prep object':>11} {'prep category':>13}")
+    for n_scope, n_vendors, n_rounds in SCALES:
+        tables = tco.build_tables(make_rounds(n_scope, n_vendors, n_rounds))
+        for name, typed in tables.items():
+            untyped = as_object(typed)
+            mb_object = untyped.memory_usage(deep=True).sum() / 2**20
+            mb_typed = typed.memory_usage(deep=True).sum() / 2**20
+            t0 = time.perf_counter()
+            export.prepare_sheet(untyped, name)
+            t_object = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            export.prepare_sheet(typed, name)
+            t_typed = time.perf_counter() - t0
+            print(
+                f"{n_scope:>5}×{n_vendors:>3}×{n_rounds:>3} {name:>24} | {mb_object:>9.1f} {mb_typed:>11.1f} "
+                f"{mb_object / mb_typed:>5.1f}x | {t_object:>10.3f}s {t_typed:>12.3f}s"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Styler.apply per baris (axis=1) vs mask satu tabel (styling.py).
+
+Jalankan dari root repo:  python -m benchmarks.bench_style
+"compute" = Styler._compute saja (tempat fungsi style dijalankan);
+"render" = _compute + _translate, jalur yang sama dengan st.dataframe(styler).
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+import styling
+import tco
+from benchmarks.bench_bid_price import make_merge
+
+ROWS = [1_000, 10_000, 50_000]
+
+def legacy_highlight_total(row):
+    if any(str(x).strip().upper() == "TOTAL" for x in row):
+        return ["font-weight: bold; background-color: #D9EAD3; color: #1A5E20;"] * len(row)
+    else:
+        return [""] * len(row)
+
+def legacy_highlight_1st_2nd(row, columns):
+    styles = [""] * len(columns)
+    first_vendor = row.get("1st Vendor")
+    second_vendor = row.get("2nd Vendor")
+
+    for i, col in enumerate(columns):
+        if col == first_vendor:
+            styles[i] = "background-color: #C6EFCE; color: #006100;"
+        elif col == second_vendor:
+            styles[i] = "background-color: #FFEB9C; color: #9C6500;"
+    return styles
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+def measure(df, legacy, vectorized):
+    # → (compute lama, compute baru, render lama, render baru); ctx dicek sama
+    old, t_old = timed(lambda: df.style.apply(legacy, axis=1)._compute())
+    new, t_new = timed(lambda: df.style.pipe(vectorized)._compute())
+    assert dict(old.ctx) == dict(new.ctx)
+    _, r_old = timed(lambda: old._translate(False, False))
+    _, r_new = timed(lambda: new._translate(False, False))
+    return t_old, t_new, t_old + r_old, t_new + r_new
+
+def main():
+    print(f"{'table':>12} {'rows':>7} | {'compute old':>11} {'new':>8} {'speedup':>8} | {'render old':>10} {'new':>8}")
+    for n_rows in ROWS:
+        df_merge, key_cols, vendor_cols = make_merge(n_rows, 10)
+        # satu baris TOTAL tiap 20 baris, seperti Merge Data per round
+        df_merge.loc[::20, key_cols[-1]] = tco.TOTAL
+        df_analysis = tco.bid_price_analysis(df_merge, key_cols, vendor_cols)
+
+        cases = [
+            ("Merge", df_merge, legacy_highlight_total, styling.highlight_total),
+            ("Bid & Price", df_analysis,
+             lambda row: legacy_highlight_1st_2nd(row, df_analysis.columns), styling.highlight_1st_2nd),
+        ]
+        for name, df, legacy, vectorized in cases:
+            t_old, t_new, r_old, r_new = measure(df, legacy, vectorized)
+            print(
+                f"{name:>12} {len(df):>7} | {t_old:>10.3f}s {t_new:>7.3f}s {t_old / t_new:>7.1f}x | "
+                f"{r_old:>9.3f}s {r_new:>7.3f}s"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Suite benchmark jalur utama halaman, dari file round .xlsx sampai workbook.
+
+Jalankan dari root repo:  python -m benchmarks.bench_suite [--scales small,medium]
+File round dibuat synthetic.write_round_files (tabel floating, tanpa kolom
+"No", tanpa baris TOTAL) untuk tiap skala rounds × vendors × scope rows,
+lalu tiap tahap diukur --repeat kali (dicatat min & median):
+  ingest     ingest.load_rounds tanpa parse cache
+  cube       tco.PriceCube + Merge Data
+  summary    Cost Summary          pivot      Pivot Table
+  bid&price  Bid & Price Analysis  movement   Price Movement Analysis
+  style      Styler Merge Data (rupiah_formatters + highlight_total),
+             _compute + _translate seperti st.dataframe
+  export     export.cached_multi_sheet_excel (cache kosong tiap kali),
+             semua sheet, seperti Super Button di halaman
+Hasil disimpan sebagai JSON (--output); --compare FILE membandingkan dengan
+hasil run sebelumnya dan exit 1 kalau ada tahap yang lebih lambat dari
+--threshold × waktu lama.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+import export
+import ingest
+import styling
+import tco
+from benchmarks.synthetic import write_round_files
+from formatting import rupiah_formatters
+
+SCALES = {
+    # nama: (rounds, vendors, scope rows)
+    "small": (4, 5, 200),
+    "medium": (8, 10, 2_000),
+    "large": (12, 20, 10_000),
+}
+STAGES = ["ingest", "cube", "summary", "pivot", "bid&price", "movement", "style", "export"]
+
+def timed(fn, repeat):
+    # → (hasil run terakhir, [detik per run])
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t0)
+    return result, times
+
+def render_merge(df_merge, vendor_cols):
+    styler = (
+        df_merge.style
+        .format(rupiah_formatters(df_merge, vendor_cols))
+        .pipe(styling.highlight_total)
+    )
+    styler._compute()
+    return styler._translate(False, False)
+
+def export_workbook(tables):
+    # jalur cache miss Super Button; workbook besar dikembalikan sebagai file
+    data = export.cached_multi_sheet_excel(list(tables), tables, cache=export.WorkbookCache())
+    if not isinstance(data, bytes):
+        with data:
+            data = data.read()
+    return data
+
+def run_scale(n_rounds, n_vendors, n_scope, repeat):
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_round_files(tmp, n_rounds, n_vendors, n_scope)
+        rounds, t_ingest = timed(lambda: ingest.load_rounds(paths, cache=None)[0], repeat)
+
+    cube, t_cube = timed(lambda: tco.PriceCube(rounds), repeat)
+    df_merge, t_merge = timed(lambda: tco.merge_data(cube), repeat)
+    tables = {"Merge Data": df_merge}
+    tables["Cost Summary"], t_summary = timed(lambda: tco.cost_summary(cube), repeat)
+    tables["Pivot Table"], t_pivot = timed(lambda: tco.pivot_table(cube), repeat)
+    tables["Bid & Price Analysis"], t_bid = timed(
+        lambda: tco.bid_price_analysis(df_merge, cube.key_cols, cube.vendor_cols), repeat
+    )
+    tables["Price Movement Analysis"], t_move = timed(lambda: tco.price_movement(cube), repeat)
+    tables = {name: tco.apply_schema(df) for name, df in tables.items()}
+    _, t_style = timed(lambda: render_merge(tables["Merge Data"], cube.vendor_cols), repeat)
+    workbook, t_export = timed(lambda: export_workbook(tables), repeat)
+
+    times = [t_ingest, [a + b for a, b in zip(t_cube, t_merge)], t_summary, t_pivot,
+             t_bid, t_move, t_style, t_export]
+    return {
+        "rows": {name: len(df) for name, df in tables.items()},
+        "workbook_bytes": len(workbook),
+        "stages": {
+            stage: {"min": min(t), "median": statistics.median(t), "runs": t}
+            for stage, t in zip(STAGES, times)
+        },
+    }
+
+def environment():
+    try:
+        rev = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        rev = None
+    return {
+        "git_rev": rev,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "cpus": os.cpu_count(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+def compare(results, baseline, threshold):
+    # → daftar (skala, tahap, rasio) yang lebih lambat dari threshold
+    regressions = []
+    print(f"\nvs {baseline['environment'].get('git_rev')} ({baseline['environment'].get('time')}), min new / min old:")
+    for scale, result in results["scales"].items():
+        old = baseline["scales"].get(scale)
+        if old is None or old["shape"] != result["shape"]:
+            continue
+        ratios = []
+        for stage in STAGES:
+            if stage not in old["stages"]:
+                ratios.append(f"{'-':>9}")
+                continue
+            ratio = result["stages"][stage]["min"] / old["stages"][stage]["min"]
+            flag = "!" if ratio > threshold else " "
+            ratios.append(f"{ratio:>8.2f}{flag}")
+            if ratio > threshold:
+                regressions.append((scale, stage, ratio))
+        print(f"{scale:>8} | " + " ".join(ratios))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the main page pipeline on synthetic round files")
+    parser.add_argument("--scales", default="small,medium", help=f"comma list of {', '.join(SCALES)}")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="JSON result file (default: benchmarks/results/suite-<time>.json)")
+    parser.add_argument("--compare", help="earlier JSON result to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio counted as regression")
+    args = parser.parse_args()
+
+    results = {"environment": environment(), "repeat": args.repeat, "scales": {}}
+    print(f"{'scale':>8} | " + " ".join(f"{stage:>9}" for stage in STAGES))
+    for scale in args.scales.split(","):
+        shape = SCALES[scale]
+        result = run_scale(*shape, args.repeat)
+        result["shape"] = dict(zip(["rounds", "vendors", "scope_rows"], shape))
+        results["scales"][scale] = result
+        print(f"{scale:>8} | " + " ".join(f"{result['stages'][s]['min']:>8.3f}s" for s in STAGES))
+
+    output = args.output or os.path.join(
+        "benchmarks", "results", f"suite-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nsaved {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            for scale, stage, ratio in regressions:
+                print(f"regression: {scale} {stage} {ratio:.2f}x slower", file=sys.stderr)
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
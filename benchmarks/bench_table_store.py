@@ -0,0 +1,91 @@
+"""Memori tabel hasil: DataFrame biasa vs view memory-mapped dari table_store.
+
+Jalankan dari root repo:  python -m benchmarks.bench_table_store
+Tiap mode dijalankan di proses baru. "anon" = RSS privat proses (yang
+ditanggung tiap proses/worker Streamlit), "file" = halaman file yang
+di-map (dibagi lewat page cache). Session dalam satu proses memakai tabel
+yang sama lewat static_cache, jadi angka per proses = angka untuk semua
+session di proses itu.
+"""
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import export
+import table_store
+import tco
+from benchmarks.synthetic import make_rounds
+
+SCALES = [
+    # (scope rows, vendors, rounds)
+    (5_000, 20, 8),
+    (20_000, 40, 8),
+]
+
+def mib(n):
+    return n / 2**20
+
+def child(mode, n_scope, n_vendors, n_rounds, directory):
+    store = table_store.TableStore(directory)
+    seed = os.path.join(directory, "seed.txt")
+    build = lambda paths: tco.build_tables(make_rounds(n_scope, n_vendors, n_rounds))
+
+    gc.collect()
+    before = table_store.resident_memory()
+    t0 = time.perf_counter()
+    if mode == "memory":
+        tables = build([seed])
+    else:
+        tables = table_store.cached_tables([seed], build, store)
+    t_load = time.perf_counter() - t0
+    gc.collect()
+    loaded = table_store.resident_memory()
+
+    # baca semua nilai sekali (seperti export / hash workbook)
+    for df in tables.values():
+        export.frame_hash(df)
+    gc.collect()
+    touched = table_store.resident_memory()
+
+    print(json.dumps({
+        "load_s": t_load,
+        "anon_loaded": loaded["anon"] - before["anon"],
+        "anon_touched": touched["anon"] - before["anon"],
+        "file_touched": touched["file"] - before["file"],
+        "cells": sum(df.size for df in tables.values()),
+    }))
+
+def run(mode, *args):
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_table_store", "--child", mode, *map(str, args)],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main():
+    print(f"{'scope':>6} {'vendor':>6} {'round':>5} {'cells':>11} | {'mode':>7} {'load':>7} "
+          f"{'anon':>9} {'anon read':>10} {'file read':>10}")
+    for n_scope, n_vendors, n_rounds in SCALES:
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "seed.txt"), "w") as f:
+                f.write(f"{n_scope} {n_vendors} {n_rounds}")
+            args = (n_scope, n_vendors, n_rounds, directory)
+            run("mapped", *args)  # isi store dulu
+            for mode in ("memory", "mapped"):
+                r = run(mode, *args)
+                print(
+                    f"{n_scope:>6} {n_vendors:>6} {n_rounds:>5} {r['cells']:>11,} | {mode:>7} "
+                    f"{r['load_s']:>6.2f}s {mib(r['anon_loaded']):>7.0f}MiB "
+                    f"{mib(r['anon_touched']):>8.0f}MiB {mib(r['file_touched']):>8.0f}MiB"
+                )
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        mode, n_scope, n_vendors, n_rounds, directory = sys.argv[2:]
+        child(mode, int(n_scope), int(n_vendors), int(n_rounds), directory)
+    else:
+        main()
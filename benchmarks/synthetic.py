@@ -0,0 +1,52 @@
+"""Round sintetis: file .xlsx yang mengikuti aturan di user guide, atau
+langsung dalam bentuk hasil ingest.load_rounds."""
+import os
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+
+def write_round_files(directory, n_rounds, n_vendors, n_scope, seed=0, offset=(2, 1), trailing_rows=0):
+    # Round 1..N.xlsx, satu sheet, tabel floating mulai di `offset`
+    # (baris, kolom); tanpa kolom "No" dan tanpa baris TOTAL.
+    # trailing_rows: baris kosong berformat di bawah tabel (used range besar)
+    rng = np.random.default_rng(seed)
+    base = rng.integers(1_000, 50_000_000, (n_scope, n_vendors)).astype(float)
+    header = ["Scope", "TCO Component"] + [f"Vendor {v + 1}" for v in range(n_vendors)]
+    scope = [f"Scope {i}" for i in range(n_scope)]
+    component = [f"Component {i % 50}" for i in range(n_scope)]
+    row0, col0 = offset
+
+    paths = []
+    for r in range(n_rounds):
+        prices = (base * rng.uniform(0.9, 1.05, base.shape)).round()
+        path = os.path.join(directory, f"Round {r + 1}.xlsx")
+        wb = xlsxwriter.Workbook(path, {"constant_memory": True})
+        ws = wb.add_worksheet("Sheet1")
+        ws.write_row(row0, col0, header)
+        for i in range(n_scope):
+            ws.write_row(row0 + 1 + i, col0, [scope[i], component[i]] + prices[i].tolist())
+        if trailing_rows:
+            fmt = wb.add_format({"bg_color": "#FFFFFF"})
+            for i in range(trailing_rows):
+                ws.write_blank(row0 + n_scope + 2 + i, 0, None, fmt)
+                ws.write_blank(row0 + n_scope + 2 + i, col0 + len(header) + 20, None, fmt)
+        wb.close()
+        paths.append(path)
+    return paths
+
+def make_rounds(n_scope, n_vendors, n_rounds, seed=0):
+    # bentuk sama dengan hasil ingest.load_rounds, tanpa baca file
+    rng = np.random.default_rng(seed)
+    key_cols = ["Scope", "TCO Component"]
+    vendor_cols = [f"Vendor {v + 1}" for v in range(n_vendors)]
+    base = rng.integers(1_000, 50_000_000, (n_scope, n_vendors)).astype(float)
+    rounds = {}
+    for r in range(n_rounds):
+        prices = base * rng.uniform(0.9, 1.05, base.shape)
+        prices[rng.random(base.shape) < 0.02] = np.nan
+        table = pd.DataFrame(prices.round(), columns=vendor_cols)
+        table.insert(0, "TCO Component", [f"Component {i % 50}" for i in range(n_scope)])
+        table.insert(0, "Scope", [f"Scope {i}" for i in range(n_scope)])
+        rounds[f"Round {r + 1}"] = (table, key_cols, vendor_cols)
+    return rounds
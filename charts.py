@@ -0,0 +1,148 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import tco
+
+# Grafik tab Visualization, dibuat dari tabel hasil. Data diringkas dulu di
+# pandas/numpy (hitungan per vendor × round / trend), jadi spec Vega-Lite
+# cuma membawa beberapa puluh titik, bukan data per baris. Spec di-cache
+# per hash data ringkasan. altair baru di-import saat spec benar-benar
+# dibangun (cache miss), bukan saat halaman dibuka.
+# Warna vendor: palet tetap sampai 10 vendor, skema Vega "category20"
+# sampai 20, lebih dari itu warna diambil merata dari skema "turbo"
+# (satu warna per vendor, tidak berulang).
+VENDOR_COLORS = [
+    "#C3D3E3", "#0066C5", "#FDA9A9", "#FFCB09", "#7BC67E",
+    "#FF8A3D", "#9B7BD4", "#5BC0DE", "#D4A373", "#8C8C8C",
+]
+TREND_ORDER = ["Consistently Down", "Consistently Up", "No Change", "Fluctuating"]
+
+def _pair_counts(a, b):
+    # jumlah baris per pasangan (a, b), baris dengan nilai kosong dilewati
+    a_codes, a_labels = tco.factorize(a)
+    b_codes, b_labels = tco.factorize(b)
+    valid = (a_codes >= 0) & (b_codes >= 0)
+    flat = a_codes[valid].astype(np.int64) * len(b_labels) + b_codes[valid]
+    counts = np.bincount(flat, minlength=len(a_labels) * len(b_labels))
+    return counts.reshape(len(a_labels), len(b_labels)), a_labels, b_labels
+
+# ===== AGGREGATION =====
+def win_counts(df_analysis):
+    # jumlah scope yang dimenangkan (1st Vendor) tiap vendor per round.
+    # Vendor yang pernah menang saja, urut total menang terbanyak; round
+    # tanpa kemenangan tetap muncul sebagai 0
+    counts, rounds, vendors = _pair_counts(df_analysis[tco.ROUND], df_analysis["1st Vendor"])
+    totals = counts.sum(axis=0)
+    winners = [i for i in np.argsort(-totals, kind="stable").tolist() if totals[i] > 0]
+    return pd.DataFrame({
+        tco.ROUND: np.repeat(np.array(rounds, dtype=object), len(winners)),
+        tco.VENDOR: np.tile(np.array(vendors, dtype=object)[winners], len(rounds)),
+        "WINS": counts[:, winners].ravel(),
+    })
+
+def trend_counts(df_pmove):
+    # jumlah seri (komponen) per label PRICE TREND tiap vendor; baris TOTAL
+    # tidak punya trend jadi tidak ikut
+    counts, vendors, trends = _pair_counts(df_pmove[tco.VENDOR], df_pmove["PRICE TREND"])
+    vendor_idx, trend_idx = np.nonzero(counts)
+    return pd.DataFrame({
+        "PRICE TREND": np.array(trends, dtype=object)[trend_idx],
+        tco.VENDOR: np.array(vendors, dtype=object)[vendor_idx],
+        "COUNT": counts[vendor_idx, trend_idx],
+    })
+
+# ===== CHART SPECS =====
+def _vendor_color(vendors):
+    import altair as alt
+
+    if len(vendors) <= len(VENDOR_COLORS):
+        scale = alt.Scale(domain=vendors, range=VENDOR_COLORS)
+    elif len(vendors) <= 20:
+        scale = alt.Scale(domain=vendors, scheme="category20")
+    else:
+        scale = alt.Scale(domain=vendors, scheme=alt.SchemeParams(name="turbo", count=len(vendors)))
+    return alt.Color(f"{tco.VENDOR}:N", title="Vendor", sort=vendors, scale=scale)
+
+def win_chart(wins):
+    import altair as alt
+
+    rounds = list(dict.fromkeys(wins[tco.ROUND]))
+    vendors = list(dict.fromkeys(wins[tco.VENDOR]))
+    return alt.Chart(wins, title="Winning Performance Across Rounds").mark_line(
+        point=alt.OverlayMarkDef(size=120, filled=True), strokeWidth=3
+    ).encode(
+        x=alt.X(f"{tco.ROUND}:N", title="Round", sort=rounds, axis=alt.Axis(labelAngle=0)),
+        y=alt.Y("WINS:Q", title="Number of Wins", axis=alt.Axis(tickMinStep=1)),
+        color=_vendor_color(vendors),
+        tooltip=[tco.ROUND, tco.VENDOR, "WINS"],
+    )
+
+def trend_chart(trends):
+    import altair as alt
+
+    vendors = list(dict.fromkeys(trends[tco.VENDOR]))
+    order = [t for t in TREND_ORDER if t in set(trends["PRICE TREND"])]
+    return alt.Chart(trends, title="Price Trend Distribution per Vendor").mark_bar().encode(
+        x=alt.X("PRICE TREND:N", title=None, sort=order, axis=alt.Axis(labelAngle=0)),
+        xOffset=alt.XOffset(f"{tco.VENDOR}:N", sort=vendors),
+        y=alt.Y("COUNT:Q", title="Number of Occurrences", axis=alt.Axis(tickMinStep=1)),
+        color=_vendor_color(vendors).legend(orient="bottom"),
+        tooltip=["PRICE TREND", tco.VENDOR, "COUNT"],
+    )
+
+class SpecCache:
+    # spec Vega-Lite (dict) per (jenis grafik, hash data ringkasan), LRU
+    # dibatasi jumlah entri; dipakai bersama semua session dalam satu proses
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, kind, data):
+        h = hashlib.sha256(f"{kind}:{list(data.columns)}".encode())
+        h.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+        return h.hexdigest()
+
+    def get(self, kind, data, build):
+        key = self.key(kind, data)
+        with self._lock:
+            spec = self._entries.get(key)
+            if spec is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return spec
+            self.misses += 1
+
+        spec = build(data).to_dict()
+        with self._lock:
+            self._entries[key] = spec
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return spec
+
+    def entries(self):
+        with self._lock:
+            return dict(self._entries)
+
+    def preload(self, specs):
+        # spec yang sudah jadi (mis. dari snapshot), {key: spec}
+        with self._lock:
+            self._entries.update(specs)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+spec_cache = SpecCache()
+
+def win_chart_spec(df_analysis, cache=spec_cache):
+    return cache.get("wins", win_counts(df_analysis), win_chart)
+
+def trend_chart_spec(df_pmove, cache=spec_cache):
+    return cache.get("trends", trend_counts(df_pmove), trend_chart)
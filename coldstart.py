@@ -0,0 +1,126 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+import charts
+import ingest
+import table_store
+import tco
+
+# Cold start halaman: snapshot opsional tabel demo yang sudah dihitung, dan
+# profil run pertama (import + bagian dari metrics.mark). Snapshot = satu
+# entry TableStore (file Arrow, dibaca lewat memory map) + spec grafik,
+# dibuat sekali dengan `python coldstart.py build` lalu dipakai kalau
+# TCO_SNAPSHOT=1. Key-nya tetap SHA isi file round + versi kode tabel, jadi
+# snapshot yang sudah basi tidak terpakai; untuk file demo itu diberi
+# warning (dan gagal di tests/test_coldstart.py), bukan diam-diam build
+# penuh.
+SNAPSHOT_DIR = os.environ.get(
+    "TCO_SNAPSHOT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshot")
+)
+DEMO_FILES = ["Round 1.xlsx", "Round 2.xlsx", "Round 3.xlsx", "Round 4.xlsx"]
+
+# ===== SNAPSHOT =====
+def snapshot_enabled():
+    return os.environ.get("TCO_SNAPSHOT", "") not in ("", "0")
+
+def snapshot_store():
+    return table_store.TableStore(SNAPSHOT_DIR, max_bytes=float("inf"))
+
+def cached_tables(paths, build):
+    # snapshot dulu (kalau diaktifkan & cocok), lalu table_store biasa
+    if snapshot_enabled():
+        store = snapshot_store()
+        tables = store.get(store.key(paths))
+        if tables is not None:
+            try:
+                with open(os.path.join(SNAPSHOT_DIR, "specs.json")) as f:
+                    charts.spec_cache.preload(json.load(f))
+            except FileNotFoundError:
+                pass
+            return tables
+        if [os.path.basename(str(path)) for path in paths] == DEMO_FILES:
+            warnings.warn("Demo snapshot does not match the current code; rebuild it with `python coldstart.py build`")
+    return table_store.cached_tables(paths, build)
+
+def build_snapshot(paths):
+    # tabel demo + spec grafiknya, ditulis ulang dari nol
+    store = snapshot_store()
+    store.clear()
+    tables = tco.build_tables(ingest.load_rounds(paths, cache=None)[0])
+    if not store.put(store.key(paths), tables):
+        raise ValueError("Tables could not be stored as Arrow")
+    cache = charts.SpecCache()
+    charts.win_chart_spec(tables["Bid & Price Analysis"], cache)
+    charts.trend_chart_spec(tables["Price Movement Analysis"], cache)
+    with open(os.path.join(SNAPSHOT_DIR, "specs.json"), "w") as f:
+        json.dump(cache.entries(), f)
+    return store.stats()
+
+# ===== STARTUP PROFILE =====
+_PROFILE_SCRIPT = """
+import sys
+from streamlit.testing.v1 import AppTest
+print("coldstart: app run", file=sys.stderr, flush=True)
+at = AppTest.from_file("app.py", default_timeout=300).run()
+assert not at.exception, at.exception
+"""
+
+def profile(snapshot=False):
+    # cold start di proses baru (cache parse & tabel kosong): waktu import
+    # modul top-level selama run pertama (python -X importtime) + bagian
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(
+            os.environ,
+            TCO_STARTUP_PROFILE="1",
+            TCO_SNAPSHOT="1" if snapshot else "0",
+            TCO_TABLE_STORE_DIR=os.path.join(tmp, "tables"),
+            TCO_PARSE_CACHE_DIR=os.path.join(tmp, "parse"),
+        )
+        t0 = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _PROFILE_SCRIPT],
+            env=env, capture_output=True, text=True, check=True,
+        )
+        total = time.perf_counter() - t0
+
+    imports, sections, started = [], [], False
+    for line in result.stderr.splitlines():
+        if line.startswith("coldstart: app run"):
+            started = True
+        elif line.startswith('{"startup_profile"'):
+            sections = json.loads(line)["startup_profile"]
+        elif started and line.startswith("import time:"):
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if not name[1:].startswith(" "):    # top-level, bukan import bertingkat
+                imports.append((name.strip(), int(cumulative) / 1e6))
+    return {"total": total, "imports": imports, "sections": sections}
+
+if __name__ == "__main__":
+    # python coldstart.py build [files...] | profile [--snapshot]
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the demo snapshot or profile a cold start")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_cmd = sub.add_parser("build", help="precompute the demo tables into the snapshot")
+    build_cmd.add_argument("paths", nargs="*", default=DEMO_FILES)
+    profile_cmd = sub.add_parser("profile", help="import and section times of a cold first run")
+    profile_cmd.add_argument("--snapshot", action="store_true", help="run with TCO_SNAPSHOT=1")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        stats = build_snapshot(args.paths)
+        print(f"{stats['directory']}: {stats['entries']} entry, {stats['bytes'] / 1024:.1f} KiB")
+    else:
+        report = profile(args.snapshot)
+        print(f"cold first run (process start → AppTest done): {report['total']:.2f}s")
+        print("imports during the first run:")
+        for name, seconds in sorted(report["imports"], key=lambda item: -item[1])[:12]:
+            print(f"  {name:<36} {seconds * 1e3:>8.1f} ms")
+        print("sections:")
+        for name, seconds in report["sections"]:
+            print(f"  {name:<36} {seconds * 1e3:>8.1f} ms")
@@ -0,0 +1,95 @@
+import hashlib
+import os
+import tempfile
+
+# Dasar cache di disk yang dipakai ParseCache (ingest) dan TableStore
+# (table_store): satu entry per key (file atau folder) di `directory`, LRU
+# berdasarkan mtime entry (get() meng-utime entry yang dipakai), dibatasi
+# total ukuran. Subclass menentukan get/put, cara mengenali entry di
+# folder (_entry) dan cara menghapusnya (_remove).
+
+def code_version(*sources):
+    # hash source modul (nama file di folder ini) yang menentukan isi entry
+    # cache. Cache hidup lintas restart di tempdir, jadi versi yang dinaikkan
+    # manual gampang terlupa; perubahan apa pun (termasuk komentar) membuat
+    # key baru. Akhir baris disamakan ke LF, supaya checkout CRLF tidak
+    # dianggap kode lain
+    h = hashlib.sha256()
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in sources:
+        with open(os.path.join(here, name), "rb") as f:
+            h.update(f.read().replace(b"\r\n", b"\n"))
+    return h.hexdigest()[:16]
+
+class DiskLRU:
+    env_var = None        # variabel environment untuk folder cache
+    default_dir = None    # nama folder di tempdir kalau env_var tidak diisi
+
+    def __init__(self, directory=None, max_bytes=256 * 1024 * 1024):
+        self.directory = directory or os.environ.get(
+            self.env_var, os.path.join(tempfile.gettempdir(), self.default_dir)
+        )
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, entry):
+        # os.DirEntry → (key, bytes), atau None kalau bukan entry cache
+        raise NotImplementedError
+
+    def _remove(self, key):
+        raise NotImplementedError
+
+    def entries(self):
+        # isi cache, paling lama tidak dipakai dulu
+        if not os.path.isdir(self.directory):
+            return []
+        items = []
+        for entry in os.scandir(self.directory):
+            found = self._entry(entry)
+            if found is not None:
+                key, size = found
+                items.append({"key": key, "bytes": size, "last_used": entry.stat().st_mtime})
+        return sorted(items, key=lambda item: item["last_used"])
+
+    def _evict(self, keep=0):
+        # entry paling lama dibuang sampai total ukuran <= max_bytes;
+        # `keep` entry terbaru tidak pernah dibuang
+        items = self.entries()
+        total = sum(item["bytes"] for item in items)
+        for item in items[:len(items) - keep]:
+            if total <= self.max_bytes:
+                break
+            self._remove(item["key"])
+            total -= item["bytes"]
+
+    def clear(self):
+        for item in self.entries():
+            self._remove(item["key"])
+
+    def stats(self):
+        items = self.entries()
+        return {
+            "directory": self.directory,
+            "entries": len(items),
+            "bytes": sum(item["bytes"] for item in items),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+def main(cache, description, info="info", clear="clear"):
+    # CLI kecil: tampilkan isi cache, atau kosongkan dulu lalu tampilkan
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("command", choices=[info, clear])
+    args = parser.parse_args()
+
+    if args.command == clear:
+        cache.clear()
+    stats = cache.stats()
+    print(f"{stats['directory']}: {stats['entries']} entries, {stats['bytes'] / 2**20:.1f} / {stats['max_bytes'] / 2**20:.0f} MiB")
+    for item in cache.entries():
+        print(f"  {item['key'][:16]}  {item['bytes'] / 1024:>8.1f} KiB  last used {time.ctime(item['last_used'])}")
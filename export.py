@@ -0,0 +1,453 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import warnings
+from collections import OrderedDict
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+import metrics
+import tco
+
+# ===== FORMAT IDS =====
+# setiap cell dapat satu id; id 0 = tanpa format
+FMT_NONE, FMT_RUPIAH, FMT_PCT, FMT_TOTAL, FMT_FIRST, FMT_SECOND = range(6)
+
+def _add_formats(workbook):
+    return {
+        FMT_NONE: None,
+        FMT_RUPIAH: workbook.add_format({"num_format": "#,##0"}),
+        FMT_PCT: workbook.add_format({"num_format": '#,##0.0"%"'}),
+        FMT_TOTAL: workbook.add_format({
+            "bold": True,
+            "bg_color": "#D9EAD3",
+            "font_color": "#1A5E20",
+            "num_format": "#,##0"
+        }),
+        FMT_FIRST: workbook.add_format({
+            "bg_color": "#C6EFCE",
+            "num_format": "#,##0"
+        }),
+        FMT_SECOND: workbook.add_format({
+            "bg_color": "#FFEB9C",
+            "num_format": "#,##0"
+        }),
+    }
+
+def is_declared_text(series):
+    # kolom teks dari schema tco (category): tidak perlu dicek pd.to_numeric
+    return isinstance(series.dtype, pd.CategoricalDtype)
+
+def coerce_numeric(df_raw, numeric_cols=None):
+    # ===== COERCE NUMERIC SAFELY =====
+    # kolom yang punya minimal satu nilai angka dianggap numeric. Kolom yang
+    # sudah bertipe angka tidak disalin (bisa berupa view read-only dari
+    # table_store); cuma kolom lain yang dikonversi ke salinan baru.
+    # numeric_cols boleh diberikan (mis. untuk potongan baris dari tabel
+    # yang kolom numeric-nya sudah ditentukan)
+    df = df_raw.copy(deep=False)
+    detect = numeric_cols is None
+    if detect:
+        numeric_cols = []
+
+    for col in df.columns:
+        if df[col].dtype.kind in "iuf":
+            if detect and df[col].notna().any():
+                numeric_cols.append(col)
+            continue
+        if is_declared_text(df[col]) or (not detect and col not in numeric_cols):
+            continue
+        coerced = pd.to_numeric(df[col], errors="coerce")
+        if not detect:
+            df[col] = coerced
+        elif coerced.notna().any():
+            df[col] = coerced
+            numeric_cols.append(col)
+
+    return df, numeric_cols
+
+def numeric_columns(df_raw, chunk_rows=10_000):
+    # sama dengan kolom numeric dari coerce_numeric, dicek per chunk baris
+    # (berhenti di chunk pertama yang punya angka)
+    numeric_cols = []
+    for col in df_raw.columns:
+        series = df_raw[col]
+        if series.dtype.kind in "iuf":
+            found = series.notna().any()
+        elif is_declared_text(series):
+            found = False
+        else:
+            found = any(
+                pd.to_numeric(series.iloc[first:first + chunk_rows], errors="coerce").notna().any()
+                for first in range(0, len(series), chunk_rows)
+            )
+        if found:
+            numeric_cols.append(col)
+    return numeric_cols
+
+def format_ids(df, sheet, numeric_cols):
+    # matriks rows × cols berisi format id tiap cell
+    n_rows, n_cols = df.shape
+    pct_cols = [c for c in df.columns if "%" in c]
+
+    base = np.full(n_cols, FMT_NONE, dtype=np.int8)
+    for col_idx, col_name in enumerate(df.columns):
+        if col_name in pct_cols:
+            base[col_idx] = FMT_PCT
+        elif col_name in numeric_cols:
+            base[col_idx] = FMT_RUPIAH
+
+    # warna khusus baris/cell: TOTAL, atau 1st/2nd vendor di Bid & Price
+    override = np.full((n_rows, n_cols), FMT_NONE, dtype=np.int8)
+    if sheet == "Bid & Price Analysis":
+        first_vendor = df["1st Vendor"].to_numpy()
+        second_vendor = df["2nd Vendor"].to_numpy()
+        for col_idx, col_name in enumerate(df.columns):
+            if col_name not in numeric_cols:
+                continue
+            is_first = first_vendor == col_name
+            override[is_first, col_idx] = FMT_FIRST
+            override[~is_first & (second_vendor == col_name), col_idx] = FMT_SECOND
+    else:
+        override[tco.is_total_row(df, [c for c in df.columns if c not in numeric_cols])] = FMT_TOTAL
+
+    # cell kosong cuma dapat warna khusus, bukan format kolomnya
+    blank = df.isna().to_numpy()
+    for col_idx, col_name in enumerate(df.columns):
+        if col_name in numeric_cols:
+            blank[:, col_idx] |= np.isinf(df[col_name].to_numpy(dtype="float64"))
+
+    ids = np.where(override != FMT_NONE, override, base[np.newaxis, :])
+    ids[blank] = override[blank]
+    return ids
+
+def column_values(series, col_ids):
+    # nilai siap tulis: NaN/None → None (blank). ±inf tanpa format khusus
+    # tetap "inf"/"-inf", sama seperti yang ditulis pandas to_excel
+    values = series.to_numpy(dtype=object, copy=True)
+    values[pd.isna(series).to_numpy()] = None
+    if series.dtype.kind == "f":
+        arr = series.to_numpy()
+        plain = col_ids == FMT_NONE
+        values[(arr == np.inf) & plain] = "inf"
+        values[(arr == -np.inf) & plain] = "-inf"
+        values[np.isinf(arr) & ~plain] = None
+    return values
+
+def write_sheet(worksheet, df, ids, formats):
+    # tulis per kolom, satu write_column untuk tiap run format yang sama
+    if not len(df):
+        return
+    for col_idx, col_name in enumerate(df.columns):
+        col_ids = ids[:, col_idx]
+        values = column_values(df[col_name], col_ids)
+
+        bounds = np.flatnonzero(col_ids[1:] != col_ids[:-1]) + 1
+        starts = np.concatenate([[0], bounds])
+        ends = np.concatenate([bounds, [len(col_ids)]])
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            worksheet.write_column(
+                start + 1, col_idx, values[start:end].tolist(), formats[col_ids[start]]
+            )
+
+def write_sheet_rows(worksheet, df, ids, formats, first_row=1):
+    # versi urut baris untuk mode constant_memory (xlsxwriter hanya bisa
+    # menulis baris yang sedang aktif): baris dengan pola format id yang
+    # sama berbagi potongan run yang sama, dihitung sekali per pola
+    patterns, pattern_of_row = np.unique(ids, axis=0, return_inverse=True)
+    runs = []
+    for pattern in patterns:
+        bounds = np.flatnonzero(pattern[1:] != pattern[:-1]) + 1
+        starts = np.concatenate([[0], bounds]).tolist()
+        ends = np.concatenate([bounds, [len(pattern)]]).tolist()
+        runs.append([(start, end, formats[pattern[start]]) for start, end in zip(starts, ends)])
+
+    columns = [column_values(df[col], ids[:, i]).tolist() for i, col in enumerate(df.columns)]
+    rows = zip(*columns, strict=True)
+    for row_idx, (row, pattern) in enumerate(zip(rows, pattern_of_row.ravel().tolist()), first_row):
+        for start, end, fmt in runs[pattern]:
+            worksheet.write_row(row_idx, start, row[start:end], fmt)
+
+def _max_text_len(series, chunk_rows=20_000):
+    # panjang str(nilai) terpanjang; teks dari nilai unik, angka per chunk
+    # supaya tidak ada salinan str seluruh kolom sekaligus
+    if series.dtype.kind == "O":
+        codes, uniques = pd.factorize(series)
+        # NaN/None tidak ikut uniques, panjangnya ("nan"/"None") dicek terpisah
+        parts = [pd.Series(uniques, dtype=object), series[codes < 0]]
+    else:
+        parts = (series.iloc[first:first + chunk_rows] for first in range(0, len(series), chunk_rows))
+    lengths = [part.astype(str).str.len().max() for part in parts]
+    return max((n for n in lengths if pd.notna(n)), default=0)
+
+def autofit_widths(df):
+    return [
+        max(len(str(col)), _max_text_len(df[col])) + 2
+        for col in df.columns
+    ]
+
+def prepare_sheet(df_raw, sheet):
+    # isi sheet siap tulis: nilai bertipe, format id tiap cell, lebar kolom
+    df, numeric_cols = coerce_numeric(df_raw)
+    return df, format_ids(df, sheet, numeric_cols), autofit_widths(df)
+
+def write_workbook(writer, selected_sheets, df_dict):
+    formats = _add_formats(writer.book)
+
+    for sheet in selected_sheets:
+        df, ids, widths = prepare_sheet(df_dict[sheet], sheet)
+
+        # header ditulis pandas (style header default), isi ditulis sendiri
+        df.head(0).to_excel(writer, index=False, sheet_name=sheet)
+        worksheet = writer.sheets[sheet]
+        write_sheet(worksheet, df, ids, formats)
+
+        # ===== AUTOFIT =====
+        for i, width in enumerate(widths):
+            worksheet.set_column(i, i, width)
+
+# Fungsi "Super Button" & Formatting
+def generate_multi_sheet_excel(selected_sheets, df_dict):
+
+    output = BytesIO()
+
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
+        write_workbook(writer, selected_sheets, df_dict)
+
+    output.seek(0)
+    return output.getvalue()
+
+# ===== STREAMING EXPORT =====
+# Untuk workbook besar: xlsxwriter mode constant_memory (baris langsung
+# di-flush ke file sementara, bukan disimpan sebagai model di memori) dan
+# hasilnya ditulis ke temp file, bukan BytesIO. Sheet disiapkan dan ditulis
+# per chunk baris, jadi memori tidak ikut naik dengan jumlah baris. Yang
+# dikembalikan file object-nya; tidak ada salinan bytes di sisi export.
+STREAMING_CELLS = 1_000_000
+
+def stream_sheet(worksheet, df_raw, sheet, formats, chunk_rows=10_000):
+    # → lebar kolom (autofit), dihitung bertahap dari tiap chunk
+    numeric_cols = numeric_columns(df_raw, chunk_rows)
+    longest = [0] * len(df_raw.columns)
+    for first in range(0, len(df_raw), chunk_rows):
+        chunk, _ = coerce_numeric(df_raw.iloc[first:first + chunk_rows], numeric_cols)
+        write_sheet_rows(worksheet, chunk, format_ids(chunk, sheet, numeric_cols), formats, first + 1)
+        longest = [max(n, _max_text_len(chunk[col])) for n, col in zip(longest, chunk.columns)]
+    return [max(len(str(col)), n) + 2 for col, n in zip(df_raw.columns, longest)]
+
+def download_file(output):
+    # download_button hanya menerima str, bytes, BytesIO, BufferedReader
+    # atau RawIOBase; temp file (BufferedRandom) ditolak ("Callable returned
+    # unsupported type"). Dibuka ulang read-only lewat fd yang sama, jadi
+    # isinya tidak disalin di sisi export
+    output.seek(0)
+    reader = open(os.dup(output.fileno()), "rb")
+    output.close()
+    return reader
+
+def spooled_multi_sheet_excel(selected_sheets, df_dict):
+    # → BufferedReader berisi workbook (lihat download_file)
+    output = tempfile.TemporaryFile(suffix=".xlsx")
+    try:
+        options = {"constant_memory": True, "tmpdir": tempfile.gettempdir()}
+        with pd.ExcelWriter(output, engine="xlsxwriter", engine_kwargs={"options": options}) as writer:
+            formats = _add_formats(writer.book)
+            for sheet in selected_sheets:
+                df_raw = df_dict[sheet]
+                df_raw.head(0).to_excel(writer, index=False, sheet_name=sheet)
+                worksheet = writer.sheets[sheet]
+                for i, width in enumerate(stream_sheet(worksheet, df_raw, sheet, formats)):
+                    worksheet.set_column(i, i, width)
+    except BaseException:
+        output.close()
+        raise
+    return download_file(output)
+
+# ===== PARALLEL SHEETS =====
+# Tiap sheet ditulis di proses worker sendiri sebagai workbook satu sheet
+# (constant_memory → string inline, jadi XML sheet tidak bergantung pada
+# shared string table). Proses utama membuat kerangka workbook (header
+# semua sheet sesuai urutan pilihan user) lalu XML tiap sheet diganti
+# dengan hasil worker. Syaratnya indeks style sama di semua workbook:
+# format didaftarkan dengan urutan tetap, dan styles.xml dicek identik.
+# Kalau tidak identik (mis. xlsxwriter versi lain mengubah cara indeks XF
+# diberikan), workbook ditulis ulang di satu proses, bukan gagal saat
+# download. Worker dari workers.process_pool (forkserver, bukan fork dari
+# server Streamlit yang multi-thread).
+PARALLEL_CELLS = 200_000
+
+class _StylesDiffer(Exception):
+    pass
+
+def _register_formats(formats):
+    # xlsxwriter memberi indeks XF saat format pertama kali dipakai; paksa
+    # urutannya sama di kerangka dan di semua worker. _get_xf_index bukan
+    # API publik (xlsxwriter dipin ke 3.x di requirements.txt); kalau
+    # hilang, styles.xml tidak cocok dan export jatuh ke jalur satu proses
+    for fmt in formats.values():
+        if fmt is not None and hasattr(fmt, "_get_xf_index"):
+            fmt._get_xf_index()
+
+def _sheet_workbook(job):
+    # dijalankan di worker: satu sheet → file xlsx sementara (path)
+    sheet, df_raw, selected = job
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    options = {"constant_memory": True, "tmpdir": tempfile.gettempdir()}
+    with pd.ExcelWriter(path, engine="xlsxwriter", engine_kwargs={"options": options}) as writer:
+        formats = _add_formats(writer.book)
+        _register_formats(formats)
+        df_raw.head(0).to_excel(writer, index=False, sheet_name=sheet)
+        worksheet = writer.sheets[sheet]
+        for i, width in enumerate(stream_sheet(worksheet, df_raw, sheet, formats)):
+            worksheet.set_column(i, i, width)
+        if not selected:
+            # hanya sheet pertama workbook akhir yang aktif (tabSelected)
+            writer.book.add_worksheet("_").activate()
+    return path
+
+def parallel_multi_sheet_excel(selected_sheets, df_dict, workers=None):
+    # → BufferedReader berisi workbook; isi sama dengan spooled_multi_sheet_excel
+    import zipfile
+
+    from workers import process_pool
+
+    jobs = [(sheet, df_dict[sheet], i == 0) for i, sheet in enumerate(selected_sheets)]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers > 1:
+        with process_pool(workers) as pool:
+            parts = list(pool.map(_sheet_workbook, jobs))
+    else:
+        parts = [_sheet_workbook(job) for job in jobs]
+
+    try:
+        skeleton = BytesIO()
+        options = {"constant_memory": True}
+        with pd.ExcelWriter(skeleton, engine="xlsxwriter", engine_kwargs={"options": options}) as writer:
+            _register_formats(_add_formats(writer.book))
+            for sheet in selected_sheets:
+                df_dict[sheet].head(0).to_excel(writer, index=False, sheet_name=sheet)
+
+        output = tempfile.TemporaryFile(suffix=".xlsx")
+        with zipfile.ZipFile(skeleton) as base, \
+                zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as out:
+            styles = base.read("xl/styles.xml")
+            replaced = {f"xl/worksheets/sheet{i + 1}.xml": part for i, part in enumerate(parts)}
+            for info in base.infolist():
+                part = replaced.get(info.filename)
+                if part is None:
+                    out.writestr(info, base.read(info))
+                    continue
+                with zipfile.ZipFile(part) as sheet_zip:
+                    if sheet_zip.read("xl/styles.xml") != styles:
+                        raise _StylesDiffer
+                    with sheet_zip.open("xl/worksheets/sheet1.xml") as src, \
+                            out.open(info.filename, "w", force_zip64=True) as dst:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+    except _StylesDiffer:
+        output.close()
+        warnings.warn("Sheet styles differ from workbook styles; writing the workbook in one process")
+        return spooled_multi_sheet_excel(selected_sheets, df_dict)
+    finally:
+        for part in parts:
+            os.remove(part)
+    return download_file(output)
+
+# ===== CACHE WORKBOOK =====
+def frame_hash(df):
+    # hash isi dataframe (kolom, dtype, semua nilai), bukan identitas objeknya
+    h = hashlib.sha256()
+    h.update(repr((list(df.columns), [str(t) for t in df.dtypes])).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+def workbook_key(selected_sheets, df_dict):
+    # urutan sheet ikut jadi bagian key
+    return tuple((sheet, frame_hash(df_dict[sheet])) for sheet in selected_sheets)
+
+class WorkbookCache:
+    # LRU dengan batas total ukuran bytes, dipakai bersama semua session
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= len(self._entries.pop(key))
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, old = self._entries.popitem(last=False)
+                self._size -= len(old)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+workbook_cache = WorkbookCache()
+
+# batas model cell di memori: ~130 B/cell → puncak ~13 MB
+IN_MEMORY_CELLS = 100_000
+
+@metrics.timed("export")
+def cached_multi_sheet_excel(selected_sheets, df_dict, cache=workbook_cache):
+    # lebih dari satu sheet & CPU: sheet ditulis paralel per proses.
+    # Workbook besar: streaming ke temp file, tidak disimpan di cache memori
+    cells = sum(df_dict[sheet].size for sheet in selected_sheets)
+    parallel = min(os.cpu_count() or 1, len(selected_sheets)) > 1 and cells >= PARALLEL_CELLS
+    if cells >= STREAMING_CELLS:
+        if parallel:
+            return parallel_multi_sheet_excel(selected_sheets, df_dict)
+        return spooled_multi_sheet_excel(selected_sheets, df_dict)
+
+    # Workbook di bawah IN_MEMORY_CELLS ditulis per kolom di memori
+    # (generate_multi_sheet_excel, ~15% lebih cepat). Model cell xlsxwriter
+    # biasa (~130 B/cell) jauh lebih besar dari xlsx-nya, jadi di atas itu
+    # ditulis constant_memory ke temp file lalu dibaca sekali jadi bytes
+    # (satu salinan, dibagi semua session lewat cache)
+    key = workbook_key(selected_sheets, df_dict)
+    data = cache.get(key)
+    if data is None:
+        if cells < IN_MEMORY_CELLS:
+            data = generate_multi_sheet_excel(selected_sheets, df_dict)
+        else:
+            build = parallel_multi_sheet_excel if parallel else spooled_multi_sheet_excel
+            with build(selected_sheets, df_dict) as output:
+                data = output.read()
+        cache.put(key, data)
+    return data
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+
+def format_rupiah(x):
+    if pd.isna(x):
+        return ""
+    # pastikan bisa diubah ke float
+    try:
+        x = float(x)
+    except:
+        return x  # biarin apa adanya kalau bukan angka
+
+    # kalau tidak punya desimal (misal 7000.0), tampilkan tanpa ,00
+    if x.is_integer():
+        formatted = f"{int(x):,}".replace(",", ".")
+    else:
+        formatted = f"{x:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        # hapus ,00 kalau desimalnya 0 semua (misal 7000,00 → 7000)
+        if formatted.endswith(",00"):
+            formatted = formatted[:-3]
+    return formatted
+
+# Batas aman: di atas ini float64 tidak lagi presisi sampai 2 desimal,
+# jadi nilainya diserahkan ke format_rupiah biasa
+_MAX_EXACT_CENTS = 2 ** 53
+_MAX_EXACT_INT = 2 ** 62
+
+# tabel "000".."999" dan "00".."99" supaya tidak perlu int → str per nilai
+_GROUP_TEXT = np.array([f"{i:03d}" for i in range(1000)])
+_CENT_TEXT = np.array([f"{i:02d}" for i in range(100)])
+
+def _group_thousands(n):
+    # n: array int64 >= 0 → "1.234.567" (titik sebagai pemisah ribuan)
+    if n.size == 0:
+        return n.astype(str)
+    n_groups = max(1, (len(str(int(n.max()))) + 2) // 3)
+    text = _GROUP_TEXT[n % 1000]
+    for k in range(1, n_groups):
+        group = _GROUP_TEXT[(n // 1000 ** k) % 1000]
+        text = np.char.add(np.char.add(group, "."), text)
+    text = np.char.lstrip(text, "0.")
+    return np.where(text == "", "0", text)
+
+def format_rupiah_series(s):
+    # Versi vectorized dari format_rupiah: satu kolom sekaligus, aturan sama
+    # (titik ribuan, koma desimal, tanpa ,00 kalau desimalnya nol)
+    s = pd.Series(s)
+    values = pd.to_numeric(s, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    out = np.full(len(s), "", dtype=object)
+
+    # ===== NON-NUMERIC / NaN / INF =====
+    # NaN asli → "", teks non-angka → apa adanya, inf dll → format_rupiah
+    fallback = ~np.isfinite(values) & s.notna().to_numpy()
+
+    finite = np.isfinite(values)
+    absval = np.abs(values, where=finite, out=np.zeros_like(values))
+    is_int = finite & (absval == np.trunc(absval))
+
+    # ===== INTEGER =====
+    int_mask = is_int & (absval < _MAX_EXACT_INT)
+    fallback |= is_int & ~int_mask
+
+    # ===== DESIMAL =====
+    scaled = absval * 100
+    frac_mask = finite & ~is_int & (scaled < _MAX_EXACT_CENTS)
+    # nilai yang jatuh tepat di ,xx5 bisa beda pembulatannya dengan f-string
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    fallback |= finite & ~is_int & ~frac_mask
+    fallback |= frac_mask & near_tie
+    frac_mask &= ~near_tie
+
+    cents = np.rint(scaled[frac_mask]).astype(np.int64)
+    whole = np.concatenate([absval[int_mask].astype(np.int64), cents // 100])
+    grouped = _group_thousands(whole)
+
+    n_int = int(int_mask.sum())
+    int_text = grouped[:n_int]
+    frac_text = grouped[n_int:]
+    frac = cents % 100
+    frac_text = np.where(
+        frac == 0,
+        frac_text,
+        np.char.add(np.char.add(frac_text, ","), _CENT_TEXT[frac]),
+    )
+
+    sign = np.where(values < 0, "-", "")
+    out[int_mask] = np.char.add(sign[int_mask], int_text)
+    out[frac_mask] = np.char.add(sign[frac_mask], frac_text)
+
+    for i in np.flatnonzero(fallback):
+        out[i] = format_rupiah(s.iat[i])
+
+    return pd.Series(out, index=s.index, dtype=object)
+
+class _RupiahLookup(dict):
+    # nilai yang belum ada di tabel (NaN, teks, dll) jatuh ke format_rupiah
+    def __missing__(self, x):
+        if x != x:  # NaN
+            return ""
+        return format_rupiah(x)
+
+def rupiah_formatter(s):
+    # Formatter untuk Styler.format: kolom diformat sekali secara vectorized,
+    # lalu Styler cukup lookup dict per cell
+    s = pd.Series(s)
+    lookup = _RupiahLookup(zip(s.tolist(), format_rupiah_series(s).tolist()))
+    return lookup.__getitem__
+
+def rupiah_formatters(df, cols):
+    return {col: rupiah_formatter(df[col]) for col in cols}
@@ -0,0 +1,224 @@
+import hashlib
+import io
+import json
+import os
+import time
+import warnings
+
+import pandas as pd
+import pyarrow as pa
+
+import disk_cache
+import tco
+
+# Baca file round (multi-file, satu sheet per file). Tiap file dibaca di
+# proses terpisah kalau ada lebih dari satu file dan lebih dari satu CPU,
+# dan total ukurannya minimal PARALLEL_BYTES. Parse openpyxl ~0.7 MB/s per
+# CPU, sedangkan pool proses baru butuh ~0.1-0.3 s untuk mulai; file kecil
+# (mis. 4 file demo, total 35 KB) lebih cepat dibaca berurutan.
+PARALLEL_BYTES = 512 * 1024
+
+# Tabel berhenti setelah sebanyak ini baris kosong berturut-turut (atau di
+# akhir sheet). Baris kosong yang lebih sedikit di tengah tabel dilewati,
+# baris sesudahnya tetap ikut. Sheet sering punya ribuan baris kosong
+# berformat di bawah tabel; tanpa batas ini semuanya ikut dibaca.
+BLANK_ROWS_END = 1000
+
+def _is_blank(value):
+    return (
+        value is None
+        or (isinstance(value, str) and not value.strip())
+        or (isinstance(value, float) and value != value)  # NaN dari pd.read_excel
+    )
+
+def stream_table(rows):
+    # Floating table dari baris yang di-stream: baris tidak kosong pertama
+    # = header, cell tidak kosong pertama & terakhir di header = tepi kiri
+    # & kanan, BLANK_ROWS_END baris kosong berturut-turut = tepi bawah.
+    # Cell header kosong di tengah jadi "Unnamed: <posisi>" (kolomnya
+    # dibuang kalau isinya kosong semua). Yang disimpan hanya isi kotak
+    # tabel, bukan seluruh used range sheet.
+    rows = iter(rows)
+    for row in rows:
+        filled = [i for i, v in enumerate(row) if not _is_blank(v)]
+        if filled:
+            break
+    else:
+        raise ValueError("No table found in sheet")
+
+    left, right = filled[0], filled[-1] + 1
+    header = [
+        f"Unnamed: {i}" if _is_blank(v) else str(v).strip()
+        for i, v in enumerate(row[left:right])
+    ]
+    width = right - left
+
+    body, blank_run, skipped = [], 0, 0
+    for row in rows:
+        cells = tuple(row[left:right])
+        if all(_is_blank(v) for v in cells):
+            blank_run += 1
+            if blank_run >= BLANK_ROWS_END:
+                break
+            continue
+        if blank_run and body:
+            skipped += blank_run
+        blank_run = 0
+        if len(cells) < width:
+            cells = cells + (None,) * (width - len(cells))
+        body.append(cells)
+
+    if skipped:
+        warnings.warn(
+            f"Skipped {skipped} blank row(s) inside the table; the rows after them are kept",
+            stacklevel=2,
+        )
+    table = pd.DataFrame(body, columns=header)
+    unnamed = [col for col in header if col.startswith("Unnamed: ")]
+    empty = [col for col in unnamed if table[col].map(_is_blank).all()]
+    return table.drop(columns=empty) if empty else table
+
+def frame_rows(raw):
+    # DataFrame tanpa header (pd.read_excel header=None) → baris untuk
+    # stream_table, supaya .xls dibaca dengan aturan yang sama
+    raw = raw.astype(object)
+    return raw.where(raw.notna(), None).itertuples(index=False, name=None)
+
+def read_table(source):
+    # mode read-only + values-only: cell dibaca sebagai nilai saja, gambar
+    # dan text box di sheet tidak ikut di-load
+    name = str(getattr(source, "name", source))
+    if name.lower().endswith(".xls"):
+        # format .xls lama tidak bisa dibaca openpyxl
+        return stream_table(frame_rows(pd.read_excel(source, header=None)))
+
+    import openpyxl  # ~170 ms, hanya kalau ada file yang perlu diparse
+
+    wb = openpyxl.load_workbook(source, read_only=True, data_only=True)
+    try:
+        return stream_table(wb.worksheets[0].iter_rows(values_only=True))
+    finally:
+        wb.close()
+
+def read_round(source):
+    return tco.clean_round(read_table(source))
+
+# ===== PARSE CACHE =====
+# Versi parser = hash source modul parsing (baca file + clean_round di
+# tco), lihat disk_cache.code_version
+CODE_SOURCES = ["ingest.py", "tco.py"]
+CODE_VERSION = disk_cache.code_version(*CODE_SOURCES)
+
+class ParseCache(disk_cache.DiskLRU):
+    # Cache hasil parsing per file di disk (Arrow IPC), key = SHA-256 isi
+    # file + CODE_VERSION. LRU & batas ukuran dari DiskLRU.
+    env_var = "TCO_PARSE_CACHE_DIR"
+    default_dir = "tco-parse-cache"
+
+    def key(self, data):
+        h = hashlib.sha256(f"parser-{CODE_VERSION}:".encode())
+        h.update(data)
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.arrow")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with pa.memory_map(path) as source:
+                arrow_table = pa.ipc.open_file(source).read_all()
+        except (FileNotFoundError, pa.ArrowInvalid):
+            self.misses += 1
+            return None
+        os.utime(path)  # tandai baru dipakai (LRU)
+        self.hits += 1
+        meta = json.loads(arrow_table.schema.metadata[b"tco"])
+        return arrow_table.to_pandas(), meta["key_cols"], meta["vendor_cols"]
+
+    def put(self, key, result):
+        table, key_cols, vendor_cols = result
+        try:
+            arrow_table = pa.Table.from_pandas(table, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return  # kolom campuran (mis. angka & teks) tidak di-cache
+        meta = dict(arrow_table.schema.metadata or {})
+        meta[b"tco"] = json.dumps({"key_cols": key_cols, "vendor_cols": vendor_cols}).encode()
+        arrow_table = arrow_table.replace_schema_metadata(meta)
+
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, arrow_table.schema) as writer:
+                writer.write_table(arrow_table)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def _entry(self, entry):
+        if entry.name.endswith(".arrow"):
+            return entry.name[:-len(".arrow")], entry.stat().st_size
+        return None
+
+    def _remove(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+parse_cache = ParseCache()
+
+# ===== LOAD ROUNDS =====
+def _read_job(job):
+    # dijalankan di worker: (nama file, bytes) → hasil + durasi
+    name, data = job
+    t0 = time.perf_counter()
+    source = io.BytesIO(data)
+    source.name = name
+    return read_round(source), time.perf_counter() - t0
+
+def _job(source):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return str(source), f.read()
+    source.seek(0)
+    return getattr(source, "name", "Round"), source.read()
+
+def load_rounds(sources, workers=None, cache=parse_cache):
+    # → ({round: (table, key_cols, vendor_cols)} urut regex, {round: detik})
+    # File yang isinya sudah pernah di-parse diambil dari cache; hanya
+    # sisanya yang dibaca (paralel kalau lebih dari satu)
+    rounds, timings = {}, {}
+    pending = []
+    for source in sources:
+        name, data = _job(source)
+        key = cache.key(data) if cache is not None else None
+        t0 = time.perf_counter()
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            rounds[tco.round_name(name)] = cached
+            timings[tco.round_name(name)] = time.perf_counter() - t0
+        else:
+            pending.append((name, data, key))
+
+    jobs = [(name, data) for name, data, _ in pending]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers > 1 and sum(len(data) for _, data in jobs) >= PARALLEL_BYTES:
+        from workers import process_pool
+
+        with process_pool(workers) as pool:
+            results = list(pool.map(_read_job, jobs))
+    else:
+        results = [_read_job(job) for job in jobs]
+
+    for (name, _, key), (result, seconds) in zip(pending, results):
+        rounds[tco.round_name(name)] = result
+        timings[tco.round_name(name)] = seconds
+        if cache is not None:
+            cache.put(key, result)
+
+    order = sorted(rounds, key=tco.round_sort_key)
+    return {name: rounds[name] for name in order}, {name: timings[name] for name in order}
+
+if __name__ == "__main__":
+    # python ingest.py cache-info | cache-clear
+    disk_cache.main(parse_cache, "Inspect or clear the round parse cache", "cache-info", "cache-clear")
@@ -0,0 +1,288 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import deque
+from contextlib import contextmanager
+
+# Waktu per rerun: bagian halaman (mark, berurutan dari atas script) dan
+# tahap pipeline (timed, bisa bersarang: build tabel, Styler, ZIP, export;
+# stage untuk waktu yang sudah diukur di tempat lain, mis. per file round).
+# Satu rerun = satu record; timed() di luar run script (rerun fragment,
+# klik download) jadi record sendiri. Run yang berhenti sebelum finish()
+# dicatat sebagai "aborted" saat run berikutnya di thread itu mulai. Record terbaru disimpan di memori
+# untuk panel debug (?debug=timing) dan bisa ditulis ke file:
+#   TCO_METRICS_JSONL=path  satu baris JSON per record (append)
+#   TCO_METRICS_PROM=path   teks Prometheus, total & jumlah per nama
+#                           (ditimpa, paling sering sekali per detik)
+# Cuma perf_counter + append list per titik ukur, jadi ongkosnya
+# mikrodetik per rerun. Modul ini di-import paling awal oleh app.py,
+# jangan import modul berat di sini.
+# TCO_TRACEMALLOC=1: tiap record juga membawa memori Python (tracemalloc)
+# saat mulai, puncak, dan akhir run/event. tracemalloc memperlambat semua
+# alokasi (bisa beberapa kali lipat), jadi hanya untuk investigasi. Puncak
+# tracemalloc cuma satu untuk seluruh proses: hanya di-reset kalau tidak ada
+# pengukuran lain yang sedang jalan (run script atau event di thread lain),
+# supaya puncak pengukuran itu tidak hilang. Record yang tumpang tindih
+# dengan pengukuran lain ditandai memory["shared"]; puncaknya gabungan semua
+# thread sejak reset terakhir, jadi batas atas, bukan angka run itu sendiri.
+RECENT = 200
+PROM_INTERVAL = 1.0
+
+_local = threading.local()
+_lock = threading.Lock()
+recent = deque(maxlen=RECENT)    # record terbaru, semua session
+first_run = None                 # bagian-bagian run script pertama proses ini
+_totals = {}                     # (jenis, nama) → [detik, jumlah]
+_runs = {}                       # jenis record → jumlah
+_peaks = {}                      # jenis record → kenaikan memori puncak terbesar
+_prom_written = 0.0
+_measuring = weakref.WeakSet()   # pengukuran memori yang sedang jalan, semua thread
+
+if os.environ.get("TCO_TRACEMALLOC") and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+# ===== COLLECTOR =====
+class _Measure:
+    # satu pengukuran memori; weakref supaya run yang berhenti tanpa
+    # finish() ikut hilang dari _measuring saat thread-nya selesai
+    __slots__ = ("start", "shared", "__weakref__")
+
+def _memory_start():
+    if not tracemalloc.is_tracing():
+        return None
+    measure = _Measure()
+    with _lock:
+        measure.shared = len(_measuring) > 0
+        if measure.shared:
+            for other in _measuring:
+                other.shared = True
+        else:
+            tracemalloc.reset_peak()
+        _measuring.add(measure)
+    measure.start = tracemalloc.get_traced_memory()[0]
+    return measure
+
+def _memory(measure):
+    if measure is None:
+        return None
+    with _lock:
+        _measuring.discard(measure)
+    if not tracemalloc.is_tracing():
+        return None
+    current, peak = tracemalloc.get_traced_memory()
+    return {"start": measure.start, "peak": peak, "end": current, "shared": measure.shared}
+
+def begin():
+    # dipanggil di baris paling atas script, sebelum import modul berat.
+    # Run sebelumnya di thread ini yang tidak sampai finish() (exception,
+    # st.stop, rerun di tengah jalan) dicatat dulu sebagai "aborted"
+    if getattr(_local, "sections", None) is not None:
+        total = time.perf_counter() - _local.start
+        _record("aborted", total, _local.sections, _local.stages, _memory(_local.memory))
+    _local.sections = []
+    _local.stages = []
+    _local.memory = _memory_start()
+    _local.start = _local.last = time.perf_counter()
+
+def mark(name):
+    # waktu sejak mark sebelumnya (atau begin) dicatat sebagai bagian `name`
+    sections = getattr(_local, "sections", None)
+    if sections is None:
+        return
+    now = time.perf_counter()
+    sections.append((name, now - _local.last))
+    _local.last = now
+
+def _script_stages():
+    # list tahap run script yang sedang jalan di thread ini, atau None.
+    # Rerun fragment memakai thread script yang sama tapi bukan bagian run
+    # terakhir, yang bisa saja belum di-finish() karena exception
+    stages = getattr(_local, "stages", None)
+    if stages is None:
+        return None
+    scriptrunner = sys.modules.get("streamlit.runtime.scriptrunner")
+    if scriptrunner is not None:
+        ctx = scriptrunner.get_script_run_ctx(suppress_warning=True)
+        if ctx is not None and ctx.fragment_ids_this_run:
+            return None
+    return stages
+
+@contextmanager
+def timed(name):
+    # tahap pipeline; di luar run script dicatat sebagai record sendiri
+    stages = _script_stages()
+    memory = _memory_start() if stages is None else None
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - t0
+        if stages is not None and getattr(_local, "stages", None) is stages:
+            stages.append((name, seconds))
+        else:
+            _record("event", seconds, [], [(name, seconds)], _memory(memory))
+
+def stage(name, seconds):
+    # tahap yang waktunya sudah diukur di tempat lain (mis. per file round
+    # di proses worker); dicatat sama seperti timed()
+    stages = _script_stages()
+    if stages is not None:
+        stages.append((name, seconds))
+    else:
+        _record("event", seconds, [], [(name, seconds)])
+
+def finish():
+    # akhir script → record run ini (None kalau begin belum dipanggil)
+    global first_run
+    sections = getattr(_local, "sections", None)
+    if sections is None:
+        return None
+    total = time.perf_counter() - _local.start
+    record = _record("script", total, sections, _local.stages, _memory(_local.memory))
+    _local.sections = _local.stages = None
+    with _lock:
+        if first_run is None:
+            first_run = sections
+            if os.environ.get("TCO_STARTUP_PROFILE"):
+                print(json.dumps({"startup_profile": sections}), file=sys.stderr, flush=True)
+    return record
+
+def _record(kind, total, sections, stages, memory=None):
+    record = {
+        "time": time.time(),
+        "kind": kind,
+        "total": total,
+        "sections": dict(sections),
+        "stages": _summed(stages),
+    }
+    if memory is not None:
+        record["memory"] = memory
+    with _lock:
+        recent.append(record)
+        _runs[kind] = _runs.get(kind, 0) + 1
+        if memory is not None:
+            _peaks[kind] = max(_peaks.get(kind, 0), memory["peak"] - memory["start"])
+        for group, items in (("section", sections), ("stage", stages)):
+            for name, seconds in items:
+                entry = _totals.setdefault((group, name), [0.0, 0])
+                entry[0] += seconds
+                entry[1] += 1
+        _write(record)
+    return record
+
+def _summed(items):
+    # nama yang sama (mis. tahap dalam loop) dijumlahkan
+    out = {}
+    for name, seconds in items:
+        out[name] = out.get(name, 0.0) + seconds
+    return out
+
+# ===== EXPORT =====
+def _write(record):
+    # dipanggil dengan _lock dipegang
+    path = os.environ.get("TCO_METRICS_JSONL")
+    if path:
+        with open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+    if time.monotonic() - _prom_written >= PROM_INTERVAL:
+        _write_prometheus()
+
+def _write_prometheus():
+    global _prom_written
+    path = os.environ.get("TCO_METRICS_PROM")
+    if not path:
+        return
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(prometheus_text())
+    os.replace(tmp_path, path)
+    _prom_written = time.monotonic()
+
+@atexit.register
+def _flush():
+    with _lock:
+        if _runs:
+            _write_prometheus()
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def prometheus_text():
+    lines = [
+        "# HELP tco_runs_total Recorded page runs (script, aborted) and standalone timings (event).",
+        "# TYPE tco_runs_total counter",
+    ]
+    lines += [f'tco_runs_total{{kind="{kind}"}} {count}' for kind, count in sorted(_runs.items())]
+    lines += [
+        "# HELP tco_seconds Time spent per page section and pipeline stage.",
+        "# TYPE tco_seconds summary",
+    ]
+    for (group, name), (seconds, count) in sorted(_totals.items()):
+        labels = f'group="{group}",name="{_label(name)}"'
+        lines.append(f"tco_seconds_sum{{{labels}}} {seconds:.6f}")
+        lines.append(f"tco_seconds_count{{{labels}}} {count}")
+    if _peaks:
+        lines += [
+            "# HELP tco_memory_peak_bytes Largest traced memory rise during one record (tracemalloc).",
+            "# TYPE tco_memory_peak_bytes gauge",
+        ]
+        lines += [f'tco_memory_peak_bytes{{kind="{kind}"}} {peak}' for kind, peak in sorted(_peaks.items())]
+    return "\n".join(lines) + "\n"
+
+def summary():
+    # per (jenis, nama) dari record terbaru: jumlah, median, p95, terakhir (detik)
+    with _lock:
+        records = list(recent)
+    values = {}
+    for record in records:
+        for group in ("sections", "stages"):
+            for name, seconds in record[group].items():
+                values.setdefault((group[:-1], name), []).append(seconds)
+    rows = []
+    for (group, name), series in values.items():
+        ordered = sorted(series)
+        rows.append({
+            "group": group,
+            "name": name,
+            "count": len(series),
+            "median": ordered[len(ordered) // 2],
+            "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            "last": series[-1],
+        })
+    return rows
+
+# ===== DEBUG PANEL =====
+def debug_panel(record):
+    # panel tersembunyi (?debug=timing): run ini + ringkasan record terbaru
+    import pandas as pd
+    import streamlit as st
+
+    with st.expander("⏱️ Timing (debug)", expanded=True):
+        if record is not None:
+            st.caption(f"This run: {record['total'] * 1e3:.1f} ms")
+            if "memory" in record:
+                memory = {k: record["memory"][k] / 2**20 for k in ("start", "peak", "end")}
+                shared = " (overlapped other runs: upper bound)" if record["memory"]["shared"] else ""
+                st.caption(
+                    f"Python memory (tracemalloc): {memory['start']:.1f} → {memory['end']:.1f} MiB, "
+                    f"peak {memory['peak']:.1f} MiB{shared}"
+                )
+            st.dataframe(
+                pd.DataFrame(
+                    [(name, seconds * 1e3) for name, seconds in record["sections"].items()]
+                    + [(name, seconds * 1e3) for name, seconds in record["stages"].items()],
+                    columns=["name", "ms"],
+                ),
+                hide_index=True,
+            )
+        rows = pd.DataFrame(summary())
+        if len(rows):
+            st.caption(f"Last {len(recent)} records, all sessions (ms)")
+            for col in ("median", "p95", "last"):
+                rows[col] *= 1e3
+            st.dataframe(rows, hide_index=True)
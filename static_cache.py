@@ -0,0 +1,52 @@
+import io
+import os
+import threading
+
+import metrics
+
+# Cache file statis (ZIP dummy dataset, tabel hasil file round)
+# untuk semua session dalam satu proses. Isinya dipakai bersama, jadi
+# anggap read-only; dibangun ulang hanya kalau mtime atau ukuran salah satu
+# file sumbernya berubah.
+_entries = {}
+_lock = threading.Lock()
+stats = {"builds": 0, "hits": 0}
+
+def _signature(paths):
+    sig = []
+    for path in paths:
+        info = os.stat(path)
+        sig.append((path, info.st_mtime_ns, info.st_size))
+    return tuple(sig)
+
+def cached_build(name, paths, build):
+    sig = _signature(paths)
+    with _lock:
+        entry = _entries.get(name)
+        if entry is not None and entry[0] == sig:
+            stats["hits"] += 1
+            return entry[1]
+
+        # build di dalam lock supaya tiap versi file hanya dibangun sekali
+        data = build(paths)
+        _entries[name] = (sig, data)
+        stats["builds"] += 1
+        return data
+
+@metrics.timed("zip")
+def _zip_bytes(paths):
+    import zipfile
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for file_path in paths:
+            zf.write(file_path, arcname=os.path.basename(file_path))  # arcname = nama file di ZIP
+    return buffer.getvalue()
+
+def zip_of(paths):
+    paths = tuple(paths)
+    return cached_build(("zip",) + paths, paths, _zip_bytes)
+
+def clear():
+    with _lock:
+        _entries.clear()
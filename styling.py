@@ -0,0 +1,52 @@
+import numpy as np
+
+import tco
+
+# Warna tabel di app. Dipakai lewat Styler.apply(..., axis=None): satu
+# panggilan untuk seluruh tabel, style dibentuk dari mask boolean, bukan
+# fungsi Python per baris.
+TOTAL_STYLE = "font-weight: bold; background-color: #D9EAD3; color: #1A5E20;"
+FIRST_STYLE = "background-color: #C6EFCE; color: #006100;"
+SECOND_STYLE = "background-color: #FFEB9C; color: #9C6500;"
+
+def total_row_mask(df):
+    # baris yang salah satu cell teksnya "TOTAL"; kolom angka/tanggal
+    # tidak mungkin berisi teks, jadi tidak perlu dicek
+    text_cols = [col for col in df.columns if df[col].dtype.kind not in "biufcmM"]
+    return tco.is_total_row(df, text_cols)
+
+def styles_from_masks(shape, masks):
+    # masks: [(mask, css)], mask boleh (rows,), (1, cols) atau (rows, cols);
+    # mask yang lebih awal menang kalau ada cell yang kena dua-duanya
+    styles = np.full(shape, "", dtype=object)
+    for mask, css in reversed(masks):
+        styles[np.broadcast_to(mask, shape)] = css
+    return styles
+
+def total_styles(df):
+    # baris TOTAL: tebal, hijau
+    return styles_from_masks(df.shape, [(total_row_mask(df)[:, np.newaxis], TOTAL_STYLE)])
+
+def first_second_styles(df):
+    # Bid & Price: cell vendor termurah (hijau) dan kedua termurah (kuning)
+    columns = np.array(df.columns, dtype=object)[np.newaxis, :]
+    first = df["1st Vendor"].to_numpy(dtype=object)[:, np.newaxis] == columns
+    second = df["2nd Vendor"].to_numpy(dtype=object)[:, np.newaxis] == columns
+    return styles_from_masks(df.shape, [(first, FIRST_STYLE), (second, SECOND_STYLE)])
+
+def apply_styles(styler, styles):
+    # Styler masih memeriksa hasil apply cell per cell, jadi apply dibatasi
+    # (subset) ke baris & kolom yang memang punya style
+    styled = styles != ""
+    rows, cols = styled.any(axis=1), styled.any(axis=0)
+    if not rows.any():
+        return styler
+    block = styles[np.ix_(rows, cols)]
+    return styler.apply(lambda _: block, axis=None, subset=(rows, cols))
+
+# Pakai lewat pipe, mis. df.style.format(...).pipe(styling.highlight_total)
+def highlight_total(styler):
+    return apply_styles(styler, total_styles(styler.data))
+
+def highlight_1st_2nd(styler):
+    return apply_styles(styler, first_second_styles(styler.data))
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import pyarrow as pa
+
+import disk_cache
+
+# Tabel hasil (Merge Data, Cost Summary, ...) disimpan sebagai file Arrow
+# IPC, satu folder per set file round, lalu dibaca lewat memory map. Kolom
+# angka jadi view read-only ke file (zero-copy, halaman dibagi lewat page
+# cache OS ke semua session dan proses); kolom teks tetap jadi object.
+# Key = SHA-256 isi semua file round + CODE_VERSION.
+
+# Versi tabel = hash source modul yang menentukan isi tabel (parsing,
+# hitungan, format simpan), lihat disk_cache.code_version. Entry lama (dan
+# snapshot/ yang di-commit) tidak terpakai lagi sampai dibangun ulang:
+# `python coldstart.py build`.
+CODE_SOURCES = ["ingest.py", "tco.py", "table_store.py"]
+CODE_VERSION = disk_cache.code_version(*CODE_SOURCES)
+
+def _to_arrow(df):
+    arrays = []
+    for col in df.columns:
+        series = df[col]
+        if series.dtype.kind == "f":
+            # NaN tetap NaN (bukan null) supaya bisa dibaca balik tanpa copy
+            arrays.append(pa.array(series.to_numpy(), from_pandas=False))
+        else:
+            arrays.append(pa.Array.from_pandas(series))
+    return pa.Table.from_arrays(arrays, names=[str(col) for col in df.columns])
+
+class TableStore(disk_cache.DiskLRU):
+    # satu folder per key; LRU & batas ukuran dari DiskLRU
+    env_var = "TCO_TABLE_STORE_DIR"
+    default_dir = "tco-table-store"
+
+    def __init__(self, directory=None, max_bytes=512 * 1024 * 1024):
+        super().__init__(directory, max_bytes)
+
+    def key(self, paths):
+        h = hashlib.sha256(f"tables-{CODE_VERSION}:".encode())
+        for path in paths:
+            with open(path, "rb") as f:
+                h.update(hashlib.sha256(f.read()).digest())
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(os.path.join(path, "tables.json")) as f:
+                names = json.load(f)
+            tables = {}
+            for i, name in enumerate(names):
+                with pa.memory_map(os.path.join(path, f"{i}.arrow")) as source:
+                    arrow_table = pa.ipc.open_file(source).read_all()
+                # split_blocks: tiap kolom float jadi block sendiri → tidak
+                # digabung (dicopy) jadi satu array 2D
+                tables[name] = arrow_table.to_pandas(split_blocks=True)
+        except (FileNotFoundError, pa.ArrowInvalid):
+            self.misses += 1
+            return None
+        os.utime(path)  # tandai baru dipakai (LRU)
+        self.hits += 1
+        return tables
+
+    def put(self, key, tables):
+        try:
+            arrow_tables = [_to_arrow(df) for df in tables.values()]
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return False  # kolom campuran (mis. angka & teks) tidak disimpan
+
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = tempfile.mkdtemp(prefix=f"{key}.", suffix=".tmp", dir=self.directory)
+        for i, arrow_table in enumerate(arrow_tables):
+            with pa.OSFile(os.path.join(tmp_path, f"{i}.arrow"), "wb") as sink:
+                with pa.ipc.new_file(sink, arrow_table.schema) as writer:
+                    writer.write_table(arrow_table)
+        with open(os.path.join(tmp_path, "tables.json"), "w") as f:
+            json.dump(list(tables), f)
+
+        try:
+            os.rename(tmp_path, self._path(key))
+        except OSError:
+            shutil.rmtree(tmp_path, ignore_errors=True)  # sudah ditulis proses lain
+        self._evict()
+        return True
+
+    def _entry(self, entry):
+        if entry.is_dir() and not entry.name.endswith(".tmp"):
+            return entry.name, sum(f.stat().st_size for f in os.scandir(entry.path))
+        return None
+
+    def _remove(self, key):
+        shutil.rmtree(self._path(key), ignore_errors=True)
+
+    def _evict(self):
+        # entry terbaru (yang baru ditulis) tidak dibuang; file yang masih
+        # di-map tetap bisa dibaca setelah dihapus
+        super()._evict(keep=1)
+
+table_store = TableStore()
+
+def cached_tables(paths, build, store=table_store):
+    # build(paths) → {nama: DataFrame}. Hasil build langsung disimpan lalu
+    # dibaca ulang dari store, jadi yang dipakai selalu view ke file
+    key = store.key(paths)
+    tables = store.get(key)
+    if tables is None:
+        tables = build(paths)
+        if store.put(key, tables):
+            tables = store.get(key)
+    return tables
+
+def resident_memory():
+    # RSS proses dalam bytes: anon = memori privat, file = halaman file
+    # yang di-map (dibagi dengan proses lain lewat page cache)
+    usage = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(("RssAnon:", "RssFile:", "VmRSS:")):
+                name, value = line.split(":")
+                usage[name] = int(value.split()[0]) * 1024
+    return {"rss": usage.get("VmRSS"), "anon": usage.get("RssAnon"), "file": usage.get("RssFile")}
+
+if __name__ == "__main__":
+    # python table_store.py info | clear
+    disk_cache.main(table_store, "Inspect or clear the computed table store")
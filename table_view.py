@@ -0,0 +1,70 @@
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import metrics
+import tco
+
+# Tabel besar ditampilkan per halaman: pencarian dan pemotongan baris
+# dilakukan di server, dan hanya baris di halaman aktif yang di-format,
+# diberi warna, lalu dikirim ke browser. Tiap tabel jadi st.fragment
+# sendiri, jadi widget-nya tidak memicu rerun seluruh script.
+PAGE_SIZE = 500
+
+def search_mask(df, query):
+    # setiap kata di query harus ada (tanpa beda huruf besar/kecil) di salah
+    # satu kolom teks; dicek per nilai unik, lalu disebar lewat kode factorize
+    mask = np.ones(len(df), dtype=bool)
+    text_cols = [col for col in df.columns if df[col].dtype.kind not in "biufcmM"]
+    for term in query.lower().split():
+        hit = np.zeros(len(df), dtype=bool)
+        for col in text_cols:
+            codes, uniques = tco.factorize(df[col])
+            found = pd.Series(uniques, dtype=object).astype(str).str.lower().str.contains(term, regex=False)
+            hit |= np.append(found.to_numpy(dtype=bool), False)[codes]
+        mask &= hit
+    return mask
+
+@st.fragment
+def windowed_dataframe(df, style, key, page_size=PAGE_SIZE):
+    # style: fungsi window → Styler (format & highlight cukup untuk window).
+    # Fragment: ganti search/halaman cuma menjalankan ulang fungsi ini,
+    # bukan seluruh halaman
+    search_col, page_col = st.columns([3, 1])
+    query = search_col.text_input(
+        "Search", key=f"{key}_search", placeholder="🔍 Search rows...", label_visibility="collapsed"
+    )
+    rows = np.flatnonzero(search_mask(df, query))
+
+    n_pages = max(1, math.ceil(len(rows) / page_size))
+    page = 1
+    if n_pages > 1:
+        page_key = f"{key}_page"
+        # query baru → kembali ke halaman 1; selain itu jaga supaya posisi
+        # halaman tidak melewati jumlah halaman hasil filter
+        if st.session_state.get(f"{key}_last_query", "") != query:
+            st.session_state[page_key] = 1
+        elif st.session_state.get(page_key, 1) > n_pages:
+            st.session_state[page_key] = n_pages
+        page = page_col.number_input(
+            "Page", min_value=1, max_value=n_pages, key=page_key, label_visibility="collapsed"
+        )
+
+    start = (page - 1) * page_size
+    window = df.iloc[rows[start:start + page_size]].reset_index(drop=True)
+    with metrics.timed(f"style.{key}"):
+        st.dataframe(style(window), hide_index=True)
+
+    st.session_state[f"{key}_last_query"] = query
+
+    if query and not len(rows):
+        st.caption(f"No rows match \"{query}\" (searched {len(df):,} rows)")
+    elif n_pages > 1 or query:
+        caption = f"Rows {min(start + 1, len(rows)):,}–{start + len(window):,} of {len(rows):,}"
+        if query:
+            caption += f" (filtered from {len(df):,})"
+        if n_pages > 1:
+            caption += f" · page {page} of {n_pages}"
+        st.caption(caption)
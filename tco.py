@@ -0,0 +1,383 @@
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+import metrics
+
+# Hitungan TCO Comparison Round by Round: dari file round (satu sheet per
+# file) jadi Merge Data, Cost Summary, Pivot Table, Bid & Price Analysis
+# dan Price Movement Analysis. Semua tabel diambil dari satu PriceCube
+# (round × komponen × vendor); hitungan per baris/vendor/round dibuat
+# vectorized di atas array, bukan loop per baris.
+
+ROUND = "ROUND"
+VENDOR = "VENDOR"
+PRICE = "PRICE"
+TOTAL = "TOTAL"
+
+TREND_LABELS = np.array(["Fluctuating", "No Change", "Consistently Down", "Consistently Up"], dtype=object)
+
+# ===== ROUND NAME & ORDER =====
+def round_name(source):
+    # nama file (tanpa folder & ekstensi) jadi nilai ROUND
+    name = getattr(source, "name", source)
+    return os.path.splitext(os.path.basename(str(name)))[0]
+
+def round_sort_key(name):
+    # natural sort: "L2R10" setelah "L2R9", bukan setelah "L2R1"
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r"(\d+)", name)]
+
+# ===== PARSE ROUND TABLE =====
+def split_columns(table):
+    # kolom non-numeric dulu, lalu numeric (vendor); urutan ini wajib,
+    # jadi kolom numeric pertama menandai awal blok vendor
+    for idx, col in enumerate(table.columns):
+        values = table.iloc[:, idx]
+        coerced = pd.to_numeric(values, errors="coerce")
+        if values.notna().any() and coerced.notna().sum() == values.notna().sum():
+            if idx == 0:
+                raise ValueError("Table must start with at least one non-numeric column")
+            return list(table.columns[:idx]), list(table.columns[idx:])
+    raise ValueError("Table has no numeric (vendor) columns")
+
+def factorize(values):
+    # kode per baris + nilai unik; kolom category langsung pakai kode dan
+    # kategorinya (tanpa hashing ulang)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    return pd.factorize(values)
+
+def is_total_row(df, key_cols):
+    # cek "TOTAL" cukup di nilai unik tiap kolom, lalu disebar lewat kode
+    mask = np.zeros(len(df), dtype=bool)
+    for col in key_cols:
+        codes, uniques = factorize(df[col])
+        is_total = pd.Series(uniques, dtype=object).astype(str).str.strip().str.upper().eq(TOTAL)
+        # kode -1 (NaN) jatuh ke elemen False terakhir
+        mask |= np.append(is_total.to_numpy(dtype=bool), False)[codes]
+    return mask
+
+def clean_round(table):
+    key_cols, vendor_cols = split_columns(table)
+    # TOTAL bawaan file dibuang, TOTAL dibuat ulang saat merge
+    table = table.loc[~is_total_row(table, key_cols)].reset_index(drop=True)
+    table[vendor_cols] = table[vendor_cols].apply(pd.to_numeric, errors="coerce").astype("float64")
+    return table, key_cols, vendor_cols
+
+# ===== SCHEMA =====
+# Tipe kolom tabel hasil ditetapkan di sini, bukan ditebak ulang di hilir:
+# teks (ROUND, VENDOR, komponen, vendor pemenang, trend) → category, harga
+# → float64 (sejak clean_round). Kategori diambil dari urutan kemunculan
+# (factorize), jadi nilai campuran teks & angka tetap bisa.
+def categorical(values):
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return pd.Categorical(values)
+    codes, uniques = pd.factorize(values)
+    return pd.Categorical.from_codes(codes, categories=uniques)
+
+def apply_schema(df):
+    # kolom object jadi category; kolom lain (angka) tidak diubah
+    text_cols = [col for col in df.columns if df[col].dtype == object]
+    if not text_cols:
+        return df
+    df = df.copy(deep=False)
+    for col in text_cols:
+        df[col] = categorical(df[col])
+    return df
+
+# ===== PRICE CUBE =====
+class PriceCube:
+    # Harga semua round dalam satu array `values` (round × slot × vendor).
+    # Slot = komponen (key) + urutan kemunculannya dalam satu round, urut
+    # alfabet lalu kemunculan, TOTAL paling akhir; baris duplikat dalam satu
+    # round jadi slot terpisah, tidak dijumlah. `present` (round × slot)
+    # menandai slot yang ada di file round; rows_round/rows_slot = baris
+    # file dalam urutan aslinya. Merge Data, Cost Summary, Pivot Table dan
+    # Price Movement diambil dari array ini (gather/reshape), bukan dari
+    # reshape DataFrame satu per satu.
+    def __init__(self, rounds):
+        # rounds: {round: (table, key_cols, vendor_cols)}
+        self.rounds = sorted(rounds, key=round_sort_key)
+        self.key_cols = list(rounds[self.rounds[0]][1])
+        self.vendor_cols = []
+
+        keys, blocks, rows_round = [], [], []
+        for r, name in enumerate(self.rounds):
+            table, table_keys, vendors = rounds[name]
+            # logika pakai indeks kolom: nama kolom non-numeric ikut round pertama
+            keys.append(table[table_keys].rename(columns=dict(zip(table_keys, self.key_cols))))
+            blocks.append((table[vendors].to_numpy(dtype="float64"), vendors))
+            rows_round.append(np.full(len(table), r, dtype=np.intp))
+            self.vendor_cols += [v for v in vendors if v not in self.vendor_cols]
+        keys = pd.concat(keys, ignore_index=True).reindex(columns=self.key_cols)
+        self.rows_round = np.concatenate(rows_round)
+
+        # urutan komponen = groupby sort (alfabet), kemunculan ke-n dalam round
+        key_id = keys.groupby(self.key_cols, sort=True, dropna=False).ngroup().to_numpy()
+        occurrence = pd.Series(key_id).groupby([self.rows_round, key_id]).cumcount().to_numpy()
+        stride = occurrence.max(initial=0) + 1
+        slot_codes, first_row, self.rows_slot = np.unique(
+            key_id * stride + occurrence, return_index=True, return_inverse=True
+        )
+        self.rows_slot = self.rows_slot.ravel()
+        total = pd.DataFrame([[""] * (len(self.key_cols) - 1) + [TOTAL]], columns=self.key_cols)
+        self.components = pd.concat([keys.iloc[first_row], total], ignore_index=True)
+        self.slot_key = np.append(slot_codes // stride, key_id.max(initial=-1) + 1)
+
+        n_rounds, n_slots, n_vendors = len(self.rounds), len(self.components), len(self.vendor_cols)
+        self.values = np.full((n_rounds, n_slots, n_vendors), np.nan)
+        vendor_pos = {vendor: i for i, vendor in enumerate(self.vendor_cols)}
+        for r, (block, vendors) in enumerate(blocks):
+            slots = self.rows_slot[self.rows_round == r]
+            self.values[r][np.ix_(slots, [vendor_pos[v] for v in vendors])] = block
+
+        # TOTAL = jumlah semua baris round itu (NaN kalau vendor tidak bid sama sekali)
+        data = self.values[:, :-1]
+        found = ~np.isnan(data)
+        self.values[:, -1] = np.where(found.any(axis=1), np.where(found, data, 0.0).sum(axis=1), np.nan)
+        del data, found
+
+        self.present = np.zeros((n_rounds, n_slots), dtype=bool)
+        self.present[self.rows_round, self.rows_slot] = True
+        self.present[:, -1] = True
+
+        self._codes = {}
+        self._by_component = None
+
+    def component_column(self, col, slots):
+        # kolom key untuk deretan slot, sebagai category (kategori urut slot)
+        if col not in self._codes:
+            self._codes[col] = pd.factorize(self.components[col])
+        codes, uniques = self._codes[col]
+        return pd.Categorical.from_codes(codes[slots], categories=uniques)
+
+    def by_component(self):
+        # → (slot pertama tiap komponen, harga round × komponen × vendor).
+        # Duplikat dijumlah (NaN kalau semua kosong); key kosong (NaN) tetap
+        # komponen sendiri, sama seperti pengelompokan slot. Tanpa duplikat
+        # hasilnya view langsung ke `values`.
+        if self._by_component is None:
+            starts = np.flatnonzero(np.diff(self.slot_key, prepend=-1))
+            if len(starts) == len(self.components):
+                values = self.values
+            else:
+                found = ~np.isnan(self.values)
+                values = np.add.reduceat(np.where(found, self.values, 0.0), starts, axis=1)
+                values[~np.logical_or.reduceat(found, starts, axis=1)] = np.nan
+            self._by_component = starts, values
+        return self._by_component
+
+# ===== MERGE DATA =====
+def merge_data(cube):
+    # urut round; baris file apa adanya, TOTAL di akhir tiap round
+    n_rounds = len(cube.rounds)
+    rows_round = np.concatenate([cube.rows_round, np.arange(n_rounds)])
+    rows_slot = np.concatenate([cube.rows_slot, np.full(n_rounds, len(cube.components) - 1)])
+    order = np.argsort(rows_round, kind="stable")
+    rows_round, rows_slot = rows_round[order], rows_slot[order]
+
+    out = {ROUND: pd.Categorical.from_codes(rows_round, categories=cube.rounds)}
+    for col in cube.key_cols:
+        out[col] = cube.component_column(col, rows_slot)
+    prices = pd.DataFrame(cube.values[rows_round, rows_slot], columns=cube.vendor_cols)
+    return pd.concat([pd.DataFrame(out), prices], axis=1)
+
+# ===== COST SUMMARY =====
+def cost_summary(cube):
+    # vendor jadi baris: urut round → vendor → slot (komponen alfabet, TOTAL
+    # akhir). Harga diambil langsung dari cube yang di-transpose
+    n_rounds, n_slots, n_vendors = cube.values.shape
+    per_round = cube.present.sum(axis=1)
+    slots = np.concatenate([np.tile(np.flatnonzero(p), n_vendors) for p in cube.present])
+    vendor_idx = np.concatenate([np.repeat(np.arange(n_vendors), n) for n in per_round.tolist()])
+    round_idx = np.repeat(np.arange(n_rounds), per_round * n_vendors)
+
+    long = {ROUND: pd.Categorical.from_codes(round_idx, categories=cube.rounds)}
+    long[VENDOR] = pd.Categorical.from_codes(vendor_idx, categories=cube.vendor_cols)
+    for col in cube.key_cols:
+        long[col] = cube.component_column(col, slots)
+    mask = np.broadcast_to(cube.present[:, np.newaxis, :], (n_rounds, n_vendors, n_slots))
+    long[PRICE] = cube.values.transpose(0, 2, 1)[mask]
+    return pd.DataFrame(long)
+
+# ===== PIVOT TABLE =====
+def pivot_table(cube):
+    # satu baris per komponen, kolom "vendor round"
+    slots, values = cube.by_component()
+    n_rounds, n_components, n_vendors = values.shape
+    out = {col: cube.component_column(col, slots) for col in cube.key_cols}
+    columns = [f"{vendor} {rnd}" for vendor in cube.vendor_cols for rnd in cube.rounds]
+    wide = values.transpose(1, 2, 0).reshape(n_components, n_vendors * n_rounds)
+    return pd.concat([pd.DataFrame(out), pd.DataFrame(wide, columns=columns)], axis=1)
+
+# ===== BID & PRICE ANALYSIS =====
+def lowest_two(prices):
+    # 1st & 2nd terendah per baris tanpa sort penuh: dua kali argmin.
+    # NaN (tidak bid) dianggap +inf; harga sama → vendor paling kiri dulu
+    filled = np.where(np.isnan(prices), np.inf, prices)
+    rows = np.arange(len(prices))
+    first_idx = filled.argmin(axis=1)
+    first = filled[rows, first_idx]
+    filled[rows, first_idx] = np.inf
+    second_idx = filled.argmin(axis=1)
+    filled[rows, first_idx] = first
+    return filled, first_idx, second_idx
+
+def row_median(filled, n_bids):
+    # median per baris dengan np.partition; baris dikelompokkan per jumlah
+    # bid supaya posisi tengahnya sama dalam satu kelompok (+inf di belakang)
+    median = np.full(len(filled), np.nan)
+    for n in np.unique(n_bids[n_bids > 0]).tolist():
+        rows = n_bids == n
+        lo, hi = (n - 1) // 2, n // 2
+        part = np.partition(filled[rows], [lo, hi], axis=1)
+        median[rows] = (part[:, lo] + part[:, hi]) / 2
+    return median
+
+def bid_price_analysis(df_merge, key_cols, vendor_cols):
+    is_total = is_total_row(df_merge, key_cols)
+    df = df_merge.loc[~is_total] if is_total.any() else df_merge
+    prices = df[vendor_cols].to_numpy(dtype="float64", copy=True)
+    vendors = np.array(vendor_cols, dtype=object)
+    n_bids = np.isfinite(prices).sum(axis=1)
+    rows = np.arange(len(df))
+
+    filled, first_idx, second_idx = lowest_two(prices)
+    first = np.where(n_bids >= 1, filled[rows, first_idx], np.nan)
+    second = np.where(n_bids >= 2, filled[rows, second_idx], np.nan)
+    median = row_median(filled, n_bids)
+    del filled
+
+    # persen terhadap median dihitung in-place di atas salinan harga
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gap = (second - first) / first * 100
+        to_median = prices
+        to_median -= median[:, np.newaxis]
+        to_median /= median[:, np.newaxis]
+        to_median *= 100
+
+    stats = {
+        "1st Lowest": first,
+        "1st Vendor": np.where(n_bids >= 1, vendors[first_idx], None),
+        "2nd Lowest": second,
+        "2nd Vendor": np.where(n_bids >= 2, vendors[second_idx], None),
+        "Gap 1 to 2 (%)": gap,
+        "Median Price": median,
+    }
+    # matriks persen langsung jadi satu blok, tanpa dipecah per kolom
+    to_median = pd.DataFrame(to_median, columns=[f"{v} to Median (%)" for v in vendor_cols])
+    base = df[[ROUND] + key_cols + vendor_cols].reset_index(drop=True)
+    return pd.concat([base, pd.DataFrame(stats), to_median], axis=1)
+
+# ===== PRICE MOVEMENT ANALYSIS =====
+def step_flags(values, valid):
+    # values: (series × rounds); arah tiap langkah dibanding harga terakhir
+    # yang ada (round tanpa harga dilewati) → flag naik / turun / tetap
+    n_series, n_rounds = values.shape
+    last_seen = np.where(valid, np.arange(n_rounds, dtype=np.intp), 0)
+    np.maximum.accumulate(last_seen, axis=1, out=last_seen)
+    last_seen += (np.arange(n_series, dtype=np.intp) * n_rounds)[:, np.newaxis]
+
+    # harga kosong atau belum ada harga sebelumnya → diff NaN, tidak dihitung
+    diff = values[:, 1:] - values.ravel()[last_seen[:, :-1]]
+    del last_seen
+    return (diff > 0).any(axis=1), (diff < 0).any(axis=1), (diff == 0).any(axis=1)
+
+def trend_label(up, down, flat):
+    label = np.zeros(len(up), dtype=np.int8)              # Fluctuating
+    label[~up & ~down] = 1                                # No Change
+    label[down & ~up & ~flat] = 2                         # Consistently Down
+    label[up & ~down & ~flat] = 3                         # Consistently Up
+    return TREND_LABELS[label]
+
+def movement_stats(values):
+    # values: (series × rounds) → kolom-kolom statistik Price Movement.
+    # Semua dihitung dengan mask `valid`, tanpa nan-function (yang menyalin
+    # seluruh matriks tiap kali dipanggil)
+    n_series, n_rounds = values.shape
+    valid = np.isfinite(values)
+    count = valid.sum(axis=1)
+    has_any = count > 0
+    rows = np.arange(n_series)
+
+    first = values[rows, np.argmax(valid, axis=1)]
+    last = values[rows, n_rounds - 1 - np.argmax(valid[:, ::-1], axis=1)]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zeroed = np.where(valid, values, 0.0)
+        mean = zeroed.sum(axis=1) / count
+        # std populasi (ddof=0); selisih dihitung in-place di matriks zeroed
+        zeroed -= mean[:, np.newaxis]
+        zeroed *= zeroed
+        std = np.sqrt(np.where(valid, zeroed, 0.0).sum(axis=1) / count)
+        del zeroed
+        spread = (np.where(valid, values, -np.inf).max(axis=1)
+                  - np.where(valid, values, np.inf).min(axis=1))
+
+        reduction = first - last
+        reduction_pct = reduction / first * 100
+        stability = spread / mean * 100
+
+    # seri tanpa harga sama sekali dibiarkan NaN
+    std[~has_any] = np.nan
+    stability[~has_any] = np.nan
+    return {
+        "PRICE REDUCTION (VALUE)": reduction,
+        "PRICE REDUCTION (%)": reduction_pct,
+        "PRICE TREND": np.where(has_any, trend_label(*step_flags(values, valid)), None),
+        "STANDARD DEVIATION": std,
+        "PRICE STABILITY INDEX (%)": stability,
+    }
+
+def movement_frame(components, key_cols, vendor_cols, rounds, series, stats):
+    # susun tabel Price Movement: satu baris per (vendor, komponen)
+    n_components, n_vendors = len(components), len(vendor_cols)
+    out = {VENDOR: pd.Categorical.from_codes(np.repeat(np.arange(n_vendors), n_components), categories=vendor_cols)}
+    for col in key_cols:
+        component = categorical(components[col])
+        out[col] = pd.Categorical.from_codes(np.tile(component.codes, n_vendors), categories=component.categories)
+    for i, rnd in enumerate(rounds):
+        out[rnd] = series[:, i]
+
+    # baris TOTAL cuma menampilkan harga per round
+    is_total = np.tile(is_total_row(components, key_cols), n_vendors)
+    for col, values in stats.items():
+        out[col] = np.where(is_total, None if values.dtype == object else np.nan, values)
+    return pd.DataFrame(out)
+
+def price_movement(cube):
+    # satu seri per (vendor, komponen): cube di-transpose jadi (seri × round)
+    slots, values = cube.by_component()
+    n_rounds, n_components, n_vendors = values.shape
+    components = pd.DataFrame({col: cube.component_column(col, slots) for col in cube.key_cols})
+    series = values.transpose(2, 1, 0).reshape(n_vendors * n_components, n_rounds)
+    return movement_frame(
+        components, cube.key_cols, cube.vendor_cols, cube.rounds, series, movement_stats(series)
+    )
+
+# ===== ALL TABLES =====
+def build_tables(rounds):
+    # rounds: hasil ingest.load_rounds, {round: (table, key_cols, vendor_cols)}
+    with metrics.timed("build.cube"):
+        cube = PriceCube(rounds)
+    with metrics.timed("build.merge"):
+        df_merge = merge_data(cube)
+    with metrics.timed("build.movement"):
+        df_pmove = price_movement(cube)
+    with metrics.timed("build.summary"):
+        df_summary = cost_summary(cube)
+    with metrics.timed("build.pivot"):
+        df_pivot = pivot_table(cube)
+    with metrics.timed("build.bid&price"):
+        df_analysis = bid_price_analysis(df_merge, cube.key_cols, cube.vendor_cols)
+    tables = {
+        "Merge Data": df_merge,
+        "Cost Summary": df_summary,
+        "Pivot Table": df_pivot,
+        "Bid & Price Analysis": df_analysis,
+        "Price Movement Analysis": df_pmove,
+    }
+    with metrics.timed("build.schema"):
+        return {name: apply_schema(df) for name, df in tables.items()}
@@ -0,0 +1,9 @@
+import pytest
+
+import tco
+from benchmarks.synthetic import make_rounds
+
+@pytest.fixture
+def synthetic_tables():
+    # lima tabel dari round sintetis: 50 scope × 4 vendor × 3 round
+    return tco.build_tables(make_rounds(50, 4, 3))
@@ -0,0 +1,24 @@
+import os
+import warnings
+
+import coldstart
+
+def demo_paths():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return [os.path.join(root, name) for name in coldstart.DEMO_FILES]
+
+def test_committed_snapshot_matches_current_code():
+    # gagal setelah ingest.py, tco.py atau table_store.py berubah:
+    # jalankan `python coldstart.py build` dan commit snapshot/
+    store = coldstart.snapshot_store()
+    assert store.get(store.key(demo_paths())) is not None
+
+def test_stale_snapshot_warns(monkeypatch, tmp_path):
+    monkeypatch.setenv("TCO_SNAPSHOT", "1")
+    monkeypatch.setattr(coldstart, "SNAPSHOT_DIR", str(tmp_path))
+    built = {}
+    monkeypatch.setattr(coldstart.table_store, "cached_tables", lambda paths, build: built)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert coldstart.cached_tables(demo_paths(), None) is built
+    assert any("Demo snapshot does not match" in str(w.message) for w in caught)
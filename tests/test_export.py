@@ -0,0 +1,48 @@
+import io
+
+import openpyxl
+import pytest
+from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+import export
+
+SHEETS = ["Merge Data", "Bid & Price Analysis", "Price Movement Analysis"]
+
+def download_bytes(data):
+    # sama seperti yang dilakukan download_button dengan hasil callable
+    data, _ = convert_data_to_bytes_and_infer_mime(data, unsupported_error=TypeError("unsupported type"))
+    return data
+
+def sheet_values(data):
+    wb = openpyxl.load_workbook(io.BytesIO(data), read_only=True)
+    try:
+        return {ws.title: list(ws.iter_rows(values_only=True)) for ws in wb.worksheets}
+    finally:
+        wb.close()
+
+def test_streamed_workbook_is_a_valid_download(monkeypatch, synthetic_tables):
+    df_dict = synthetic_tables
+    expected = sheet_values(download_bytes(export.cached_multi_sheet_excel(SHEETS, df_dict, cache=export.WorkbookCache())))
+
+    # workbook "besar": file-nya langsung diberikan ke Streamlit
+    monkeypatch.setattr(export, "STREAMING_CELLS", 1)
+    monkeypatch.setattr(export, "PARALLEL_CELLS", float("inf"))
+    data = export.cached_multi_sheet_excel(SHEETS, df_dict)
+    assert sheet_values(download_bytes(data)) == expected
+
+def test_parallel_workbook_matches_single_process(synthetic_tables):
+    df_dict = synthetic_tables
+    with export.spooled_multi_sheet_excel(SHEETS, df_dict) as f:
+        expected = sheet_values(f.read())
+    data = export.parallel_multi_sheet_excel(SHEETS, df_dict, workers=2)
+    assert sheet_values(download_bytes(data)) == expected
+
+def test_parallel_falls_back_when_styles_differ(monkeypatch, synthetic_tables):
+    # tanpa urutan XF yang dipaksa, kerangka & sheet worker beda styles.xml
+    df_dict = synthetic_tables
+    with export.spooled_multi_sheet_excel(SHEETS, df_dict) as f:
+        expected = sheet_values(f.read())
+    monkeypatch.setattr(export, "_register_formats", lambda formats: None)
+    with pytest.warns(UserWarning, match="Sheet styles differ"):
+        data = export.parallel_multi_sheet_excel(SHEETS, df_dict, workers=1)
+    assert sheet_values(download_bytes(data)) == expected
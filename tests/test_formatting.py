@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from formatting import format_rupiah, format_rupiah_series, rupiah_formatter
+
+CASES = {
+    "negative": [-1, -1234567, -0.5, -1234.56, -0.004, -999.999],
+    # tepat di ,xx5: pembulatannya harus sama dengan f-string
+    "half_cent": [0.125, 0.135, 1.005, 2.675, 1234.565, -0.125, 10.015],
+    "large": [2.0 ** 53, 2.0 ** 53 + 2, 1e17 + 0.5, 2.0 ** 62, 2.0 ** 63, 1e20, -1e300],
+    "non_finite": [np.inf, -np.inf, np.nan, None],
+    "text": ["abc", "1.000", "12", "", "TOTAL"],
+    "zero": [0, 0.0, -0.0, 0.001, -0.001],
+    "plain": [7000.0, 1234567.89, 0.1, 999.995, 1000.5, 12.3],
+}
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_series_matches_per_cell(name):
+    s = pd.Series(CASES[name], dtype=object)
+    assert format_rupiah_series(s).tolist() == s.map(format_rupiah).tolist()
+
+def test_series_matches_per_cell_on_random_prices():
+    rng = np.random.default_rng(0)
+    values = rng.integers(-50_000_000, 50_000_000, 20_000).astype(float)
+    values[::3] += rng.random(len(values[::3])).round(3)
+    values[::11] = np.nan
+    s = pd.Series(values)
+    assert format_rupiah_series(s).tolist() == s.map(format_rupiah).tolist()
+
+def test_formatter_lookup_falls_back_for_new_values():
+    fmt = rupiah_formatter(pd.Series([1000.0, 2.5]))
+    assert fmt(1000.0) == "1.000"
+    assert fmt(2.5) == "2,50"
+    assert fmt(np.nan) == ""
+    assert fmt(-3.0) == format_rupiah(-3.0)
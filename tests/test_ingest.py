@@ -0,0 +1,87 @@
+import warnings
+
+import openpyxl
+import pandas as pd
+import pytest
+
+import ingest
+import tco
+
+def write_sheet(path, rows, offset=(2, 1)):
+    # rows ditulis mulai dari `offset` (baris, kolom, 0-based); None = cell kosong
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for r, row in enumerate(rows):
+        for c, value in enumerate(row):
+            if value is not None:
+                ws.cell(row=offset[0] + r + 1, column=offset[1] + c + 1, value=value)
+    wb.save(path)
+    return path
+
+def read_both(path):
+    # jalur .xlsx (openpyxl streaming) dan jalur .xls (pd.read_excel) untuk sheet yang sama
+    streamed = ingest.read_table(str(path))
+    framed = ingest.stream_table(ingest.frame_rows(pd.read_excel(path, header=None)))
+    return streamed, framed
+
+def test_blank_row_inside_table_keeps_later_rows(tmp_path):
+    path = write_sheet(tmp_path / "Round 1.xlsx", [
+        ["Scope", "Component", "Vendor A", "Vendor B"],
+        ["S1", "C1", 100, 200],
+        [None, None, None, None],
+        ["S2", "C2", 110, 210],
+        ["S3", "C3", 120, 220],
+    ])
+    with pytest.warns(UserWarning, match="Skipped 1 blank row"):
+        streamed, framed = read_both(path)
+
+    assert streamed["Scope"].tolist() == ["S1", "S2", "S3"]
+    assert framed["Scope"].tolist() == ["S1", "S2", "S3"]
+    table, _, vendor_cols = tco.clean_round(streamed)
+    assert table["Vendor A"].sum() == 330
+    assert vendor_cols == ["Vendor A", "Vendor B"]
+
+def test_blank_header_cell_keeps_vendor_columns(tmp_path):
+    path = write_sheet(tmp_path / "Round 1.xlsx", [
+        ["Scope", None, "Vendor A", "Vendor B"],
+        ["S1", "C1", 100, 200],
+        ["S2", "C2", 110, 210],
+    ])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        streamed, framed = read_both(path)
+
+    assert list(streamed.columns) == ["Scope", "Unnamed: 1", "Vendor A", "Vendor B"]
+    assert list(framed.columns) == list(streamed.columns)
+    _, key_cols, vendor_cols = tco.clean_round(streamed)
+    assert key_cols == ["Scope", "Unnamed: 1"]
+    assert vendor_cols == ["Vendor A", "Vendor B"]
+
+def test_empty_unnamed_column_is_dropped(tmp_path):
+    path = write_sheet(tmp_path / "Round 1.xlsx", [
+        ["Scope", None, "Vendor A"],
+        ["S1", None, 100],
+    ])
+    streamed, framed = read_both(path)
+    assert list(streamed.columns) == list(framed.columns) == ["Scope", "Vendor A"]
+
+def test_table_ends_after_blank_rows_end(tmp_path, monkeypatch):
+    monkeypatch.setattr(ingest, "BLANK_ROWS_END", 3)
+    path = write_sheet(tmp_path / "Round 1.xlsx", [
+        ["Scope", "Vendor A"],
+        ["S1", 100],
+        [None, None],
+        [None, None],
+        [None, None],
+        ["Notes far below", None],
+    ])
+    streamed, framed = read_both(path)
+    assert streamed["Scope"].tolist() == framed["Scope"].tolist() == ["S1"]
+
+def test_parse_cache_key_follows_tco_source(monkeypatch):
+    # hasil parse berasal dari tco.clean_round juga: edit tco.py → key baru
+    assert "tco.py" in ingest.CODE_SOURCES
+    cache = ingest.ParseCache()
+    before = cache.key(b"round file")
+    monkeypatch.setattr(ingest, "CODE_VERSION", "edited")
+    assert cache.key(b"round file") != before
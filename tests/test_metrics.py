@@ -0,0 +1,71 @@
+import threading
+import tracemalloc
+from types import SimpleNamespace
+
+from streamlit.runtime import scriptrunner
+
+import metrics
+
+def last_record():
+    return metrics.recent[-1]
+
+def download_click():
+    with metrics.timed("zip"):
+        pass
+
+def test_fragment_rerun_after_failed_run_is_recorded(monkeypatch):
+    metrics.begin()
+    with metrics.timed("build.cube"):
+        pass
+    # script berhenti karena exception: finish() tidak pernah dipanggil
+
+    fragment = SimpleNamespace(fragment_ids_this_run=["merge"])
+    monkeypatch.setattr(scriptrunner, "get_script_run_ctx", lambda suppress_warning=False: fragment)
+    with metrics.timed("style.merge"):
+        pass
+    assert last_record()["kind"] == "event"
+    assert list(last_record()["stages"]) == ["style.merge"]
+
+    monkeypatch.setattr(scriptrunner, "get_script_run_ctx", lambda suppress_warning=False: None)
+    metrics.begin()
+    assert last_record()["kind"] == "aborted"
+    assert list(last_record()["stages"]) == ["build.cube"]
+    metrics.mark("imports")
+    assert metrics.finish()["kind"] == "script"
+
+def test_event_does_not_reset_peak_of_running_script(monkeypatch):
+    monkeypatch.setattr(scriptrunner, "get_script_run_ctx", lambda suppress_warning=False: None)
+    tracemalloc.start()
+    try:
+        metrics.begin()
+        block = bytearray(8 * 1024 * 1024)
+        del block
+
+        # klik download di thread lain selagi run script masih jalan
+        thread = threading.Thread(target=download_click)
+        thread.start()
+        thread.join()
+        assert last_record()["memory"]["shared"]
+
+        memory = metrics.finish()["memory"]
+        assert memory["shared"]
+        assert memory["peak"] - memory["start"] >= 8 * 1024 * 1024
+    finally:
+        tracemalloc.stop()
+
+def test_stage_records_time_measured_elsewhere(monkeypatch):
+    # waktu per file dari ingest.load_rounds (bisa diukur di proses worker)
+    monkeypatch.setattr(scriptrunner, "get_script_run_ctx", lambda suppress_warning=False: None)
+    metrics.begin()
+    with metrics.timed("build.ingest"):
+        metrics.stage("ingest.Round 1", 0.25)
+        metrics.stage("ingest.Round 2", 0.5)
+    stages = metrics.finish()["stages"]
+    assert stages["ingest.Round 1"] == 0.25
+    assert stages["ingest.Round 2"] == 0.5
+    assert "build.ingest" in stages
+
+    # di luar run script: record event sendiri
+    metrics.stage("ingest.Round 3", 0.5)
+    assert last_record()["kind"] == "event"
+    assert last_record()["stages"] == {"ingest.Round 3": 0.5}
@@ -0,0 +1,186 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import ingest
+import tco
+
+def round_table(rows, vendors=("V1", "V2")):
+    # rows: (Scope, Desc, harga per vendor...)
+    table = pd.DataFrame(rows, columns=["Scope", "Desc", *vendors])
+    table[list(vendors)] = table[list(vendors)].astype("float64")
+    return table, ["Scope", "Desc"], list(vendors)
+
+def test_blank_key_cell_is_its_own_component():
+    rounds = {
+        "R1": round_table([("A", "x", 1, 4), ("B", np.nan, 3, 5), ("C", "y", 2, 6)]),
+        "R2": round_table([("A", "x", 1, 3), ("B", np.nan, 2, 5), ("C", "y", 2, 7)]),
+    }
+    tables = tco.build_tables(rounds)
+
+    pivot = tables["Pivot Table"]
+    is_total = tco.is_total_row(pivot, ["Scope", "Desc"])
+    assert list(pivot.loc[~is_total, "Scope"]) == ["A", "B", "C"]
+    for col in ["V1 R1", "V1 R2", "V2 R1", "V2 R2"]:
+        assert pivot.loc[~is_total, col].sum() == pivot.loc[is_total, col].item()
+
+    movement = tables["Price Movement Analysis"]
+    blank = movement[(movement["Scope"] == "B") & (movement["VENDOR"] == "V1")]
+    assert blank["Desc"].isna().all()
+    assert list(blank[["R1", "R2"]].iloc[0]) == [3, 2]
+    assert blank["PRICE TREND"].item() == "Consistently Down"
+
+# ===== BID & PRICE ANALYSIS =====
+def bid_price(prices):
+    # prices: satu list harga per baris (NaN = tidak bid), vendor V1..Vn
+    vendors = [f"V{i + 1}" for i in range(len(prices[0]))]
+    df = pd.DataFrame(prices, columns=vendors, dtype="float64")
+    df.insert(0, "Scope", [f"S{i}" for i in range(len(df))])
+    df.insert(0, "ROUND", "R1")
+    return tco.bid_price_analysis(df, ["Scope"], vendors)
+
+def test_bid_price_exact_ties_pick_leftmost_vendor_first():
+    df = bid_price([[5, 3, 3, 3], [7, 7, 9, 8]])
+    assert list(df["1st Vendor"]) == ["V2", "V1"]
+    assert list(df["2nd Vendor"]) == ["V3", "V2"]
+    assert list(df["1st Lowest"]) == [3, 7]
+    assert list(df["2nd Lowest"]) == [3, 7]
+    assert list(df["Gap 1 to 2 (%)"]) == [0, 0]
+
+def test_bid_price_row_without_bids():
+    df = bid_price([[np.nan, np.nan, np.nan], [1, 2, 3]])
+    row = df.iloc[0]
+    for col in ["1st Lowest", "2nd Lowest", "Gap 1 to 2 (%)", "Median Price", "V1 to Median (%)"]:
+        assert np.isnan(row[col])
+    assert row["1st Vendor"] is None and row["2nd Vendor"] is None
+
+def test_bid_price_single_bid_has_no_second():
+    row = bid_price([[np.nan, 40, np.nan]]).iloc[0]
+    assert (row["1st Vendor"], row["1st Lowest"]) == ("V2", 40)
+    assert row["2nd Vendor"] is None
+    assert np.isnan(row["2nd Lowest"]) and np.isnan(row["Gap 1 to 2 (%)"])
+    assert row["Median Price"] == 40
+    assert row["V2 to Median (%)"] == 0
+    assert np.isnan(row["V1 to Median (%)"])
+
+def test_bid_price_median_of_even_bid_count():
+    df = bid_price([[10, 40, 20, 30], [10, np.nan, 30, np.nan]])
+    assert list(df["Median Price"]) == [25, 20]
+    assert list(df["V1 to Median (%)"]) == [-60, -50]
+    assert df["Gap 1 to 2 (%)"].tolist() == [100, 200]
+
+# ===== PRICE TREND =====
+def test_price_trend_labels():
+    nan = np.nan
+    series = np.array([
+        [5, 5, 5, 5],          # No Change
+        [5, 4, 3, 2],          # Consistently Down
+        [2, 3, 4, 5],          # Consistently Up
+        [3, 5, 4, 6],          # Fluctuating
+        [5, 4, 4, 3],          # turun + tetap → Fluctuating
+        [5, nan, 4, 3],        # round kosong dilewati
+        [5, nan, 6, 4],        # naik melewati round kosong, lalu turun
+        [nan, 7, nan, nan],    # satu harga saja
+        [nan, nan, nan, nan],  # tidak pernah bid
+    ], dtype="float64")
+    trend = tco.movement_stats(series)["PRICE TREND"]
+    assert list(trend) == [
+        "No Change", "Consistently Down", "Consistently Up", "Fluctuating", "Fluctuating",
+        "Consistently Down", "Fluctuating", "No Change", None,
+    ]
+
+# ===== DEMO FILES =====
+# Angka contoh di user guide (app.py versi awal, diketik manual) untuk
+# Round 1-4.xlsx. Persen dibulatkan 1 desimal, standar deviasi 4 desimal,
+# seperti di guide. Label komponen Pivot di guide tertukar (baris
+# "Software" berisi harga Hardware); di sini urutan yang benar: alfabet,
+# TOTAL paling akhir.
+ROOT = Path(__file__).resolve().parent.parent
+VENDORS = ["Vendor A", "Vendor B", "Vendor C"]
+PRICES = {
+    # round: [(komponen, harga A, B, C)] dalam urutan file
+    "Round 1": [("Software", 12000, 13500, 11000), ("Hardware", 25000, 24000, 23000)],
+    "Round 2": [("Software", 9850, 10230, 9570), ("Hardware", 18020, 17590, 16980)],
+    "Round 3": [("Software", 14530, 15210, 13960), ("Hardware", 31080, 29840, 28590)],
+    "Round 4": [("Software", 13420, 12090, 11560), ("Hardware", 19570, 27840, 26510)],
+}
+TOTALS = {
+    "Round 1": (37000, 37500, 34000),
+    "Round 2": (27870, 27820, 26550),
+    "Round 3": (45610, 45050, 42550),
+    "Round 4": (32990, 39930, 38070),
+}
+
+@pytest.fixture(scope="module")
+def demo_tables():
+    paths = [str(ROOT / f"Round {i}.xlsx") for i in range(1, 5)]
+    rounds, _ = ingest.load_rounds(paths, cache=None)
+    return tco.build_tables(rounds)
+
+def rows(df):
+    # DataFrame → list tuple, NaN jadi None
+    return [tuple(None if pd.isna(v) else v for v in row) for row in df.itertuples(index=False)]
+
+def test_demo_merge_data(demo_tables):
+    expected = []
+    for rnd, prices in PRICES.items():
+        expected += [(rnd, *row) for row in prices] + [(rnd, "TOTAL", *TOTALS[rnd])]
+    assert rows(demo_tables["Merge Data"]) == expected
+
+def test_demo_cost_summary(demo_tables):
+    expected = []
+    for rnd, prices in PRICES.items():
+        by_component = dict((c, p) for c, *p in prices)
+        for v, vendor in enumerate(VENDORS):
+            expected += [
+                (rnd, vendor, "Hardware", by_component["Hardware"][v]),
+                (rnd, vendor, "Software", by_component["Software"][v]),
+                (rnd, vendor, "TOTAL", TOTALS[rnd][v]),
+            ]
+    assert rows(demo_tables["Cost Summary"]) == expected
+
+def test_demo_pivot_table(demo_tables):
+    pivot = demo_tables["Pivot Table"]
+    assert list(pivot.columns) == ["TCO Component"] + [f"{v} Round {r}" for v in VENDORS for r in range(1, 5)]
+    assert rows(pivot) == [
+        ("Hardware", 25000, 18020, 31080, 19570, 24000, 17590, 29840, 27840, 23000, 16980, 28590, 26510),
+        ("Software", 12000, 9850, 14530, 13420, 13500, 10230, 15210, 12090, 11000, 9570, 13960, 11560),
+        ("TOTAL", 37000, 27870, 45610, 32990, 37500, 27820, 45050, 39930, 34000, 26550, 42550, 38070),
+    ]
+
+def test_demo_bid_price_analysis(demo_tables):
+    df = demo_tables["Bid & Price Analysis"]
+    pct_cols = ["Gap 1 to 2 (%)"] + [f"{v} to Median (%)" for v in VENDORS]
+    df = df.assign(**{col: df[col].round(1) for col in pct_cols})
+    assert rows(df) == [
+        ("Round 1", "Software", 12000, 13500, 11000, 11000, "Vendor C", 12000, "Vendor A", 9.1, 12000, 0, 12.5, -8.3),
+        ("Round 1", "Hardware", 25000, 24000, 23000, 23000, "Vendor C", 24000, "Vendor B", 4.3, 24000, 4.2, 0, -4.2),
+        ("Round 2", "Software", 9850, 10230, 9570, 9570, "Vendor C", 9850, "Vendor A", 2.9, 9850, 0, 3.9, -2.8),
+        ("Round 2", "Hardware", 18020, 17590, 16980, 16980, "Vendor C", 17590, "Vendor B", 3.6, 17590, 2.4, 0, -3.5),
+        ("Round 3", "Software", 14530, 15210, 13960, 13960, "Vendor C", 14530, "Vendor A", 4.1, 14530, 0, 4.7, -3.9),
+        ("Round 3", "Hardware", 31080, 29840, 28590, 28590, "Vendor C", 29840, "Vendor B", 4.4, 29840, 4.2, 0, -4.2),
+        ("Round 4", "Software", 13420, 12090, 11560, 11560, "Vendor C", 12090, "Vendor B", 4.6, 12090, 11, 0, -4.4),
+        ("Round 4", "Hardware", 19570, 27840, 26510, 19570, "Vendor A", 26510, "Vendor C", 35.5, 26510, -26.2, 5, 0),
+    ]
+
+def test_demo_price_movement(demo_tables):
+    df = demo_tables["Price Movement Analysis"]
+    df = df.assign(**{
+        "PRICE REDUCTION (%)": df["PRICE REDUCTION (%)"].round(1),
+        "STANDARD DEVIATION": df["STANDARD DEVIATION"].round(4),
+        "PRICE STABILITY INDEX (%)": df["PRICE STABILITY INDEX (%)"].round(1),
+    })
+    total = (None,) * 5
+    assert rows(df) == [
+        ("Vendor A", "Hardware", 25000, 18020, 31080, 19570, 5430, 21.7, "Fluctuating", 5127.2428, 55.8),
+        ("Vendor A", "Software", 12000, 9850, 14530, 13420, -1420, -11.8, "Fluctuating", 1748.5565, 37.6),
+        ("Vendor A", "TOTAL", 37000, 27870, 45610, 32990, *total),
+        ("Vendor B", "Hardware", 24000, 17590, 29840, 27840, -3840, -16, "Fluctuating", 4670.8156, 49.4),
+        ("Vendor B", "Software", 13500, 10230, 15210, 12090, 1410, 10.4, "Fluctuating", 1830.292, 39),
+        ("Vendor B", "TOTAL", 37500, 27820, 45050, 39930, *total),
+        ("Vendor C", "Hardware", 23000, 16980, 28590, 26510, -3510, -15.3, "Fluctuating", 4399.9148, 48.8),
+        ("Vendor C", "Software", 11000, 9570, 13960, 11560, -560, -5.1, "Fluctuating", 1583.3568, 38.1),
+        ("Vendor C", "TOTAL", 34000, 26550, 42550, 38070, *total),
+    ]
@@ -0,0 +1,22 @@
+import multiprocessing
+
+# Pool proses untuk parse file round (ingest) dan tulis sheet (export).
+# Server Streamlit multi-thread, jadi worker tidak di-fork langsung dari
+# proses server: fork cuma menyalin thread pemanggil, lock yang sedang
+# dipegang thread lain ikut tersalin dalam keadaan terkunci. Di Linux
+# dipakai forkserver: satu proses kecil satu thread yang sudah meng-import
+# modul berat sekali (PRELOAD), worker di-fork dari situ. Platform lain
+# pakai spawn (worker import ulang sendiri, lebih lambat mulai).
+PRELOAD = ["__main__", "ingest", "export", "openpyxl", "xlsxwriter"]
+
+def context():
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(PRELOAD)
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+def process_pool(workers):
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context())